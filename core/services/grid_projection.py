@@ -13,6 +13,7 @@ NO dependencies on Django or infrastructure layer.
 from __future__ import annotations
 
 import calendar
+import functools
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Literal
@@ -143,6 +144,24 @@ def _month_label(year: int, month: int) -> str:
     return f"{_MONTH_ABBR[month]}-{year % 100:02d}"
 
 
+@functools.lru_cache(maxsize=256)
+def _month_headers(months: int, year: int, month: int) -> tuple[str, ...]:
+    """Return *months* consecutive labels starting at (year, month).
+
+    Keyed on the start month rather than the full date, so every day of
+    a month shares one cache entry.
+    """
+    headers: list[str] = []
+    for _ in range(months):
+        headers.append(_month_label(year, month))
+        if month == 12:
+            year += 1
+            month = 1
+        else:
+            month += 1
+    return tuple(headers)
+
+
 # ---------------------------------------------------------------------------
 # GridProjectionService
 # ---------------------------------------------------------------------------
@@ -363,26 +382,18 @@ class GridProjectionService:
     def get_month_headers(
         months: int = DEFAULT_MONTHS,
         reference_date: date | None = None,
-    ) -> list[str]:
+    ) -> tuple[str, ...]:
         """Return month header labels for the grid columns.
 
+        Results are memoised per (months, start month); ``date.today()``
+        is resolved before the lookup so the cache never goes stale.
+
         Args:
             months: Number of months.
             reference_date: Start date.
 
         Returns:
-            List of month labels (e.g. ["Feb-26", "Mar-26", ...]).
+            Tuple of month labels (e.g. ("Feb-26", "Mar-26", ...)).
         """
         ref = reference_date or date.today()
-        headers: list[str] = []
-        year, month = ref.year, ref.month
-
-        for _ in range(months):
-            headers.append(_month_label(year, month))
-            if month == 12:
-                year += 1
-                month = 1
-            else:
-                month += 1
-
-        return headers
+        return _month_headers(months, ref.year, ref.month)
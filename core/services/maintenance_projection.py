@@ -68,6 +68,12 @@ TOSHIBA_HIERARCHY: dict[str, int] = {
     "RG": 3,
 }
 
+# Cycle code -> label per fleet, built once for projection lookups
+CYCLE_LABELS: dict[str, dict[str, str]] = {
+    "CSR": {code: label for code, label, _ in CSR_MAINTENANCE_CYCLES},
+    "Toshiba": {code: label for code, label, _ in TOSHIBA_MAINTENANCE_CYCLES},
+}
+
 # Average daily km by fleet (from business spec)
 AVG_DAILY_KM: dict[str, int] = {
     "CSR": 392,       # ~12.000 km/month
@@ -169,52 +175,48 @@ class MaintenanceProjectionService:
         daily_km = avg_daily_km or AVG_DAILY_KM.get(fleet_type, 392)
         ref_date = reference_date or date.today()
 
-        cycles = MaintenanceProjectionService.get_cycles_for_fleet(fleet_type)
-        cycle_lookup = {c[0]: (c[1], c[2]) for c in cycles}
+        cycle_labels = CYCLE_LABELS.get(fleet_type, CYCLE_LABELS["Toshiba"])
 
-        best: ProjectionResult | None = None
+        # Single pass to find the soonest cycle (smallest km_remaining);
+        # only the winner is turned into a ProjectionResult.
+        best_entry: dict | None = None
+        best_remaining = 0
+        best_since = 0
 
         for entry in key_data:
-            ctype = entry.get("cycle_type", "")
             cycle_km = entry.get("cycle_km", 0)
-            km_at_last = entry.get("km_at_last")
-            last_date = entry.get("last_date")
-
-            if not ctype or not cycle_km:
+            if not entry.get("cycle_type") or not cycle_km:
                 continue
 
-            label, _ = cycle_lookup.get(ctype, (ctype, cycle_km))
+            # Km since last intervention of this type (never done: from zero)
+            km_at_last = entry.get("km_at_last")
+            km_since = km_total - km_at_last if km_at_last is not None else km_total
+            km_remaining = max(0, cycle_km - km_since)
 
-            # Calculate km since last intervention of this type
-            if km_at_last is not None:
-                km_since = km_total - km_at_last
-            else:
-                km_since = km_total  # Never done, count from zero
+            if best_entry is None or km_remaining < best_remaining:
+                best_entry = entry
+                best_remaining = km_remaining
+                best_since = km_since
 
-            km_remaining = max(0, cycle_km - km_since)
+        if best_entry is None:
+            return None
 
-            # Estimate date
-            if daily_km > 0 and km_remaining > 0:
-                days_remaining = math.ceil(km_remaining / daily_km)
-            else:
-                days_remaining = 0
-            estimated = ref_date + timedelta(days=days_remaining)
-
-            candidate = ProjectionResult(
-                cycle_type=ctype,
-                cycle_label=label,
-                cycle_km=cycle_km,
-                km_remaining=km_remaining,
-                estimated_date=estimated,
-                km_since_last=km_since,
-                last_date=last_date,
-            )
-
-            # Pick the one that expires soonest (smallest km_remaining)
-            if best is None or km_remaining < best.km_remaining:
-                best = candidate
-
-        return best
+        # Estimate date
+        if daily_km > 0 and best_remaining > 0:
+            days_remaining = math.ceil(best_remaining / daily_km)
+        else:
+            days_remaining = 0
+
+        ctype = best_entry["cycle_type"]
+        return ProjectionResult(
+            cycle_type=ctype,
+            cycle_label=cycle_labels.get(ctype, ctype),
+            cycle_km=best_entry["cycle_km"],
+            km_remaining=best_remaining,
+            estimated_date=ref_date + timedelta(days=days_remaining),
+            km_since_last=best_since,
+            last_date=best_entry.get("last_date"),
+        )
 
 
 # ---------------------------------------------------------------------------
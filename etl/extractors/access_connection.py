@@ -8,9 +8,10 @@ Note: pyodbc is imported lazily to allow the application to run on systems
 without ODBC drivers (e.g., Railway Linux deployment).
 """
 
+import functools
 import logging
 import os
-from pathlib import Path
+import time
 from typing import TYPE_CHECKING, Any, Optional
 
 # Lazy import: pyodbc may not be available on all platforms (e.g., Railway Linux)
@@ -24,6 +25,11 @@ logger = logging.getLogger(__name__)
 _pyodbc_module: Optional[Any] = None
 _pyodbc_checked: bool = False
 
+# Time-based cache for is_access_available(): the file and ODBC drivers do
+# not change between requests, so one check is shared for a short window.
+ACCESS_AVAILABILITY_TTL_SECONDS = 30.0
+_AVAIL_CACHE: dict[str, Any] = {"t": 0.0, "v": None}
+
 
 def _get_pyodbc() -> Optional[Any]:
     """
@@ -59,6 +65,13 @@ def _get_env_var(name: str, default: Optional[str] = None) -> Optional[str]:
     return os.environ.get(name, default)
 
 
+def _resolve_db_path(db_path: str) -> str:
+    """Resolve a configured database path against the current directory."""
+    if os.path.isabs(db_path):
+        return db_path
+    return os.path.join(os.getcwd(), db_path)
+
+
 def _get_access_driver() -> Optional[str]:
     """
     Get the Access ODBC driver name.
@@ -89,10 +102,64 @@ def _get_access_driver() -> Optional[str]:
     return None
 
 
+def invalidate_access_availability() -> None:
+    """Discard the cached result of is_access_available()."""
+    _AVAIL_CACHE["t"] = 0.0
+    _AVAIL_CACHE["v"] = None
+
+
+@functools.lru_cache(maxsize=4)
+def _build_connection_string(driver: str, db_path: str, password: Optional[str]) -> str:
+    """
+    Build the read-only ODBC connection string.
+    
+    Cached per (driver, path, password) since the configuration rarely
+    changes while the server is running.
+    
+    Args:
+        driver: ODBC driver name.
+        db_path: Resolved path to the database file.
+        password: Database password; omitted from the string when empty.
+        
+    Returns:
+        Connection string for pyodbc.connect().
+    """
+    # ReadOnly=1 ensures we never modify the legacy database
+    conn_string = f"DRIVER={{{driver}}};DBQ={db_path};ReadOnly=1;"
+    
+    # Add password only if provided
+    if password:
+        conn_string += f"PWD={password};"
+    return conn_string
+
+
 def is_access_available() -> bool:
     """
     Check if Access database connection is available.
     
+    The result is cached for ACCESS_AVAILABILITY_TTL_SECONDS so that
+    request hot paths do not repeat the file ``stat`` and the
+    ``pyodbc.drivers()`` scan. Use invalidate_access_availability()
+    to force a fresh check.
+    
+    Returns:
+        True if all requirements are met, False otherwise.
+    """
+    now = time.monotonic()
+    cached = _AVAIL_CACHE["v"]
+    if cached is not None and now - _AVAIL_CACHE["t"] < ACCESS_AVAILABILITY_TTL_SECONDS:
+        return cached
+
+    available = _check_access_available()
+    _AVAIL_CACHE["t"] = now
+    _AVAIL_CACHE["v"] = available
+    return available
+
+
+def _check_access_available() -> bool:
+    """
+    Check if Access database connection is available (uncached).
+    
     Checks:
     1. pyodbc module is available
     2. Required environment variables are set (path is required)
@@ -115,13 +182,10 @@ def is_access_available() -> bool:
         logger.debug("Access connection not configured: LEGACY_ACCESS_DB_PATH not set")
         return False
     
-    # Check file exists
-    path_obj = Path(db_path)
-    if not path_obj.is_absolute():
-        path_obj = Path.cwd() / db_path
-    
-    if not path_obj.exists():
-        logger.debug(f"Access database file not found: {path_obj}")
+    # Check file exists (os.path avoids building a Path object per check)
+    resolved_path = _resolve_db_path(db_path)
+    if not os.path.exists(resolved_path):
+        logger.debug(f"Access database file not found: {resolved_path}")
         return False
     
     # Check driver availability
@@ -171,11 +235,9 @@ def get_access_connection() -> "pyodbc.Connection":
         )
     
     # Resolve path
-    db_path_resolved = Path(db_path)
-    if not db_path_resolved.is_absolute():
-        db_path_resolved = Path.cwd() / db_path
+    db_path_resolved = _resolve_db_path(db_path)
     
-    if not db_path_resolved.exists():
+    if not os.path.exists(db_path_resolved):
         raise AccessConnectionError(
             f"Access database file not found: {db_path_resolved}"
         )
@@ -189,20 +251,10 @@ def get_access_connection() -> "pyodbc.Connection":
             "https://www.microsoft.com/en-us/download/details.aspx?id=54920"
         )
     
-    # Build connection string
-    # ReadOnly=1 ensures we never modify the legacy database
-    conn_string = (
-        f"DRIVER={{{driver}}};"
-        f"DBQ={db_path_resolved};"
-        f"ReadOnly=1;"
-    )
-    
-    # Add password only if provided
-    if db_password:
-        conn_string += f"PWD={db_password};"
+    conn_string = _build_connection_string(driver, db_path_resolved, db_password)
     
     try:
-        logger.info(f"Connecting to Access database: {db_path_resolved.name}")
+        logger.info(f"Connecting to Access database: {os.path.basename(db_path_resolved)}")
         connection = pyodbc.connect(conn_string)
         logger.info("Access database connection established (read-only)")
         return connection
@@ -8,10 +8,14 @@ to ModuleData objects for the web interface.
 import logging
 import os
 import re
+import threading
+import time
 from collections import defaultdict
 from datetime import date, datetime, timedelta
 from typing import Any, Literal, Optional
 
+from django.db import DatabaseError
+
 from web.fleet.stub_data import (
     CoachInfo,
     MaintenanceEvent,
@@ -33,6 +37,15 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_ACCESS_QUERY_TIMEOUT_SECONDS = 30
 
+# Time-based cache for get_modules_with_fallback(): every fleet view calls
+# it, so requests within a short window share one fetch. Entries are also
+# tagged with the latest SyncLog state, so a sync_access run invalidates
+# them immediately. The lock makes concurrent misses wait for a single
+# refresh instead of each querying.
+MODULES_CACHE_TTL_SECONDS = 30.0
+_MODULES_CACHE: dict[str, Any] = {"t": 0.0, "v": None, "version": None}
+_MODULES_CACHE_LOCK = threading.Lock()
+
 
 def _get_query_timeout_seconds() -> int:
     timeout_raw = os.environ.get("LEGACY_ACCESS_QUERY_TIMEOUT", "").strip()
@@ -694,7 +707,7 @@ def extract_module_data(
     )
 
 
-def get_modules_from_access() -> list[ModuleData]:
+def get_modules_from_access(conn: Optional[Any] = None) -> list[ModuleData]:
     """
     Extract all modules from the Access database.
     
@@ -705,13 +718,19 @@ def get_modules_from_access() -> list[ModuleData]:
     - Coach composition for each EMU
     - RG/commissioning dates from CSV
     
+    Args:
+        conn: Optional open connection to reuse. When given, the caller
+            owns it and it is not closed here.
+    
     Returns:
         List of ModuleData objects
         
     Raises:
         AccessConnectionError: If connection fails
     """
-    conn = get_access_connection()
+    owns_connection = conn is None
+    if conn is None:
+        conn = get_access_connection()
     modules: list[ModuleData] = []
     
     # Load auxiliary data
@@ -940,7 +959,8 @@ def get_modules_from_access() -> list[ModuleData]:
         return modules
         
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
 
 
 def get_module_detail_from_access(
@@ -1135,6 +1155,44 @@ def get_module_detail_from_access(
         conn.close()
 
 
+def invalidate_modules_cache() -> None:
+    """Discard the cached result of get_modules_with_fallback()."""
+    with _MODULES_CACHE_LOCK:
+        _MODULES_CACHE["t"] = 0.0
+        _MODULES_CACHE["v"] = None
+        _MODULES_CACHE["version"] = None
+
+
+def get_sync_data_version() -> Optional[tuple]:
+    """
+    Identify the staging data currently loaded, from the latest SyncLog row.
+
+    A new sync_access run creates a row (new pk) and stamps finished_at
+    when done, so either change marks cached modules as outdated.
+    Returns None when there is no sync history or the DB is unreachable.
+    """
+    from infrastructure.database.models import SyncLog
+
+    try:
+        return SyncLog.objects.values_list("pk", "finished_at").first()
+    except DatabaseError as e:
+        # Cached modules then only expire by TTL, not on new syncs
+        logger.warning("Could not read the latest SyncLog version: %s", e)
+        return None
+
+
+def _modules_cache_get(version: Optional[tuple]) -> Optional[list[ModuleData]]:
+    """Return the cached module list if it is within its TTL and *version*."""
+    cached = _MODULES_CACHE["v"]
+    if (
+        cached is not None
+        and _MODULES_CACHE["version"] == version
+        and time.monotonic() - _MODULES_CACHE["t"] < MODULES_CACHE_TTL_SECONDS
+    ):
+        return cached
+    return None
+
+
 def get_modules_with_fallback() -> list[ModuleData]:
     """
     Get modules with a 3-tier fallback strategy.
@@ -1145,15 +1203,43 @@ def get_modules_with_fallback() -> list[ModuleData]:
     2. **Live ODBC to Access** — if staging is empty but Access is available.
     3. **Stub data** — development/CI fallback.
 
+    The result is cached for MODULES_CACHE_TTL_SECONDS, or until the latest
+    SyncLog row changes, and shared between requests, so callers must not
+    add or remove items from the list nor assign fields on its ModuleData
+    objects (copy them with ``dataclasses.replace`` instead). Use
+    invalidate_modules_cache() to force a fresh fetch.
+
     Returns:
         List of ModuleData objects and the source label is logged.
     """
+    version = get_sync_data_version()
+    cached = _modules_cache_get(version)
+    if cached is not None:
+        return cached
+
+    with _MODULES_CACHE_LOCK:
+        # Another request may have refreshed the cache while we waited
+        cached = _modules_cache_get(version)
+        if cached is not None:
+            return cached
+        modules = _get_modules_uncached()
+        _MODULES_CACHE["t"] = time.monotonic()
+        _MODULES_CACHE["v"] = modules
+        _MODULES_CACHE["version"] = version
+        return modules
+
+
+def _get_modules_uncached() -> list[ModuleData]:
+    """Run the 3-tier fallback of get_modules_with_fallback() without caching."""
     # --- Tier 1: Postgres staging ---
     try:
         from etl.extractors.postgres_extractor import (
             get_modules_from_postgres,
+            invalidate_postgres_staging_availability,
             is_postgres_staging_available,
         )
+        # Re-check now so the views' cached flag agrees with this source
+        invalidate_postgres_staging_availability()
         if is_postgres_staging_available():
             logger.info("Data source: Postgres staging tables")
             return get_modules_from_postgres()
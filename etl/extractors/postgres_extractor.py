@@ -15,9 +15,10 @@ Design decision (see docs/decisions/access_to_postgres_staging.md):
 
 import logging
 import re
+import time
 from collections import defaultdict
 from datetime import date, timedelta
-from typing import Literal, Optional
+from typing import Any, Iterable, Literal, Optional
 
 from django.db.models import Max, Min
 
@@ -46,6 +47,11 @@ from .access_extractor import get_rg_reference_dates
 
 logger = logging.getLogger("etl")
 
+# Time-based cache for is_postgres_staging_available(): views ask several
+# times per request and staging only changes when sync_access runs.
+POSTGRES_STAGING_TTL_SECONDS = 30.0
+_STAGING_CACHE: dict[str, Any] = {"t": 0.0, "v": None}
+
 
 # ---------------------------------------------------------------------------
 # Helpers (shared logic ported from access_extractor)
@@ -139,16 +145,33 @@ def _ubicacion_sort_key(ubicacion: Optional[str], fleet_type: str) -> int:
 # Availability check
 # ---------------------------------------------------------------------------
 
+def invalidate_postgres_staging_availability() -> None:
+    """Discard the cached result of is_postgres_staging_available()."""
+    _STAGING_CACHE["t"] = 0.0
+    _STAGING_CACHE["v"] = None
+
+
 def is_postgres_staging_available() -> bool:
     """
     Check whether the Postgres staging tables have been populated.
 
+    The result is cached for POSTGRES_STAGING_TTL_SECONDS. Use
+    invalidate_postgres_staging_availability() to force a fresh check.
+
     Returns True if ``stg_modulo`` has at least one row.
     """
+    now = time.monotonic()
+    cached = _STAGING_CACHE["v"]
+    if cached is not None and now - _STAGING_CACHE["t"] < POSTGRES_STAGING_TTL_SECONDS:
+        return cached
+
     try:
-        return StgModulo.objects.exists()
+        available = StgModulo.objects.exists()
     except Exception:
-        return False
+        available = False
+    _STAGING_CACHE["t"] = now
+    _STAGING_CACHE["v"] = available
+    return available
 
 
 # ---------------------------------------------------------------------------
@@ -395,87 +418,28 @@ def get_modules_from_postgres() -> list[ModuleData]:
 # Detail view: get_module_detail_from_postgres
 # ---------------------------------------------------------------------------
 
-def get_module_detail_from_postgres(
-    module_db_id: int,
+def _build_key_data(
+    ot_tasks: Iterable[tuple[Optional[str], Optional[date], Optional[int]]],
     module_id: str,
     fleet_type: str,
     km_total: int,
     commissioning_date: Optional[date] = None,
-) -> tuple[list[MaintenanceEvent], list[MaintenanceKeyData]]:
+) -> list[MaintenanceKeyData]:
     """
-    Load maintenance history and key cycle data from Postgres staging.
-
-    Replicates ``access_extractor.get_module_detail_from_access()`` but
-    reads from ``StgOtSimaf`` instead of live ODBC.
+    Build per-cycle key data from a module's OT rows.
 
     Args:
-        module_db_id: Numeric FK (``StgModulo.access_id``).
-        module_id: Human-readable module id (e.g. "M04").
+        ot_tasks: ``(tarea, fecha_fin, km)`` tuples for every OT of the module.
+        module_id: Human-readable module id (used for logging).
         fleet_type: "CSR" or "Toshiba".
         km_total: Current total accumulated km.
-        commissioning_date: Date of commissioning (puesta en servicio).
-            Used as fallback for DA/RG when no intervention recorded.
+        commissioning_date: Fallback date for DA/RG when none is recorded.
 
     Returns:
-        Tuple of (history, key_data).
+        One MaintenanceKeyData per maintenance cycle of the fleet.
     """
-    history: list[MaintenanceEvent] = []
     key_data: list[MaintenanceKeyData] = []
 
-    # 1. Determine cutoff date (365 days before the latest OT for this module)
-    max_fecha = (
-        StgOtSimaf.objects
-        .filter(modulo_access_id=module_db_id, fecha_fin__isnull=False)
-        .aggregate(max_f=Max("fecha_fin"))
-    )["max_f"]
-
-    reference_date = max_fecha or date.today()
-    cutoff_date = reference_date - timedelta(days=365)
-
-    # 2. History: all OTs in the last 365 days for this module
-    ot_rows = (
-        StgOtSimaf.objects
-        .filter(
-            modulo_access_id=module_db_id,
-            fecha_fin__gte=cutoff_date,
-        )
-        .order_by("-fecha_fin")
-    )
-
-    for ot in ot_rows:
-        if ot.fecha_fin is None:
-            continue
-
-        start_date = ot.fecha_inicio
-        end_date = ot.fecha_fin
-        duration_days = None
-        if start_date and end_date:
-            duration_days = (end_date - start_date).days
-
-        history.append(MaintenanceEvent(
-            event_date=end_date,
-            start_date=start_date,
-            end_date=end_date,
-            task_type=ot.tarea or "",
-            km_at_event=ot.km or 0,
-            ot_simaf=ot.ot_simaf or "",
-            duration_days=duration_days,
-        ))
-
-    logger.info(
-        "Module %s (db_id=%s): loaded %d history events from Postgres "
-        "(cutoff=%s, ref_date=%s)",
-        module_id, module_db_id, len(history), cutoff_date, reference_date,
-    )
-
-    # 3. Key data per cycle type: find latest OT for each task code
-    all_ots = (
-        StgOtSimaf.objects
-        .filter(modulo_access_id=module_db_id)
-        .exclude(tarea__isnull=True)
-        .exclude(tarea="")
-    )
-
     # Select cycles and hierarchy based on fleet type
     # Use ALL cycles for projection, but HEAVY cycles for display table
     if fleet_type == "CSR":
@@ -487,12 +451,11 @@ def get_module_detail_from_postgres(
 
     # Build lookup: task -> (latest_date, km)
     latest_by_task: dict[str, tuple[Optional[date], int]] = {}
-    for ot in all_ots:
-        task = (ot.tarea or "").strip().upper()
+    for tarea, d, km in ot_tasks:
+        task = (tarea or "").strip().upper()
         if not task:
             continue
-        d = ot.fecha_fin
-        km = ot.km or 0
+        km = km or 0
 
         if task not in latest_by_task:
             latest_by_task[task] = (d, km)
@@ -599,4 +562,135 @@ def get_module_detail_from_postgres(
         module_id, list(latest_by_cycle.keys()), len(key_data),
     )
 
+    return key_data
+
+
+def get_module_detail_from_postgres(
+    module_db_id: int,
+    module_id: str,
+    fleet_type: str,
+    km_total: int,
+    commissioning_date: Optional[date] = None,
+) -> tuple[list[MaintenanceEvent], list[MaintenanceKeyData]]:
+    """
+    Load maintenance history and key cycle data from Postgres staging.
+
+    Replicates ``access_extractor.get_module_detail_from_access()`` but
+    reads from ``StgOtSimaf`` instead of live ODBC.
+
+    Args:
+        module_db_id: Numeric FK (``StgModulo.access_id``).
+        module_id: Human-readable module id (e.g. "M04").
+        fleet_type: "CSR" or "Toshiba".
+        km_total: Current total accumulated km.
+        commissioning_date: Date of commissioning (puesta en servicio).
+            Used as fallback for DA/RG when no intervention recorded.
+
+    Returns:
+        Tuple of (history, key_data).
+    """
+    history: list[MaintenanceEvent] = []
+
+    # 1. Determine cutoff date (365 days before the latest OT for this module)
+    max_fecha = (
+        StgOtSimaf.objects
+        .filter(modulo_access_id=module_db_id, fecha_fin__isnull=False)
+        .aggregate(max_f=Max("fecha_fin"))
+    )["max_f"]
+
+    reference_date = max_fecha or date.today()
+    cutoff_date = reference_date - timedelta(days=365)
+
+    # 2. History: all OTs in the last 365 days for this module
+    ot_rows = (
+        StgOtSimaf.objects
+        .filter(
+            modulo_access_id=module_db_id,
+            fecha_fin__gte=cutoff_date,
+        )
+        .order_by("-fecha_fin")
+    )
+
+    for ot in ot_rows:
+        if ot.fecha_fin is None:
+            continue
+
+        start_date = ot.fecha_inicio
+        end_date = ot.fecha_fin
+        duration_days = None
+        if start_date and end_date:
+            duration_days = (end_date - start_date).days
+
+        history.append(MaintenanceEvent(
+            event_date=end_date,
+            start_date=start_date,
+            end_date=end_date,
+            task_type=ot.tarea or "",
+            km_at_event=ot.km or 0,
+            ot_simaf=ot.ot_simaf or "",
+            duration_days=duration_days,
+        ))
+
+    logger.info(
+        "Module %s (db_id=%s): loaded %d history events from Postgres "
+        "(cutoff=%s, ref_date=%s)",
+        module_id, module_db_id, len(history), cutoff_date, reference_date,
+    )
+
+    # 3. Key data per cycle type: find latest OT for each task code
+    ot_tasks = (
+        StgOtSimaf.objects
+        .filter(modulo_access_id=module_db_id)
+        .exclude(tarea__isnull=True)
+        .exclude(tarea="")
+        .values_list("tarea", "fecha_fin", "km")
+    )
+    key_data = _build_key_data(
+        ot_tasks, module_id, fleet_type, km_total, commissioning_date,
+    )
+
     return history, key_data
+
+
+def get_key_data_batch_from_postgres(
+    modules: Iterable[ModuleData],
+) -> dict[int, list[MaintenanceKeyData]]:
+    """
+    Load key cycle data for several modules with a single staging query.
+
+    Planner views need key data for a whole fleet; this replaces one
+    ``get_module_detail_from_postgres`` call (three queries) per module.
+    Modules without ``module_db_id`` are skipped.
+
+    Args:
+        modules: Modules to load; ``reference_date`` is used as the
+            commissioning-date fallback, as in the detail view.
+
+    Returns:
+        Dict mapping ``module_db_id`` to that module's key data.
+    """
+    targets = {m.module_db_id: m for m in modules if m.module_db_id is not None}
+    if not targets:
+        return {}
+
+    ots_by_module: dict[int, list[tuple]] = defaultdict(list)
+    rows = (
+        StgOtSimaf.objects
+        .filter(modulo_access_id__in=targets)
+        .exclude(tarea__isnull=True)
+        .exclude(tarea="")
+        .values_list("modulo_access_id", "tarea", "fecha_fin", "km")
+    )
+    for db_id, tarea, fecha_fin, km in rows:
+        ots_by_module[db_id].append((tarea, fecha_fin, km))
+
+    return {
+        db_id: _build_key_data(
+            ots_by_module.get(db_id, ()),
+            module.module_id,
+            module.fleet_type,
+            module.km_total_accumulated,
+            module.reference_date,
+        )
+        for db_id, module in targets.items()
+    }
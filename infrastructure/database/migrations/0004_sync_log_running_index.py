@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0003_sync_log'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='synclog',
+            index=models.Index(condition=models.Q(('status', 'running')), fields=['started_at'], name='ix_sync_log_running'),
+        ),
+    ]
@@ -696,6 +696,15 @@ class SyncLog(models.Model):
         verbose_name = "Log de sincronización"
         verbose_name_plural = "Logs de sincronización"
         ordering = ["-started_at"]
+        indexes = [
+            # Partial index: sync_trigger's "is a sync running?" check only
+            # ever looks at the (at most one) running row, not the history.
+            models.Index(
+                fields=["started_at"],
+                condition=models.Q(status="running"),
+                name="ix_sync_log_running",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Sync {self.started_at:%Y-%m-%d %H:%M} [{self.status}]"
@@ -8,9 +8,13 @@ from django.contrib.auth.models import User
 from django.test import Client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_module_data():
-    """Provide sample data for testing ModuleData."""
+    """Provide sample data for testing ModuleData.
+
+    Session-scoped like the module fixtures below: tests only read these
+    objects, so they are built once per run (once per xdist worker).
+    """
     from web.fleet.stub_data import ModuleData
 
     return ModuleData(
@@ -27,27 +31,23 @@ def sample_module_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def csr_modules():
     """Provide CSR modules for testing."""
     from web.fleet.stub_data import generate_csr_modules
-    import random
 
-    random.seed(42)
-    return generate_csr_modules()
+    return generate_csr_modules()  # seeded with STUB_SEED by default
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def toshiba_modules():
     """Provide Toshiba modules for testing."""
     from web.fleet.stub_data import generate_toshiba_modules
-    import random
 
-    random.seed(42)
-    return generate_toshiba_modules()
+    return generate_toshiba_modules()  # seeded with STUB_SEED by default
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def all_modules():
     """Provide all modules for testing."""
     from web.fleet.stub_data import get_all_modules
@@ -69,5 +69,5 @@ def auth_user(db):
 def authenticated_client(auth_user):
     """Provide a Django test client with an authenticated session."""
     client = Client()
-    client.login(username="analista", password="testpass123!")
+    client.force_login(auth_user)
     return client
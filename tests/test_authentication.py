@@ -17,41 +17,33 @@ from django.test import Client
 from web.fleet.stub_data import get_all_modules
 
 
+@pytest.fixture(scope="module")
+def stub_modules():
+    """Modulos stub generados una sola vez para todo el modulo de tests."""
+    return get_all_modules()
+
+
 @pytest.mark.django_db
 class TestUnauthenticatedRedirects:
     """Vistas protegidas deben redirigir a /accounts/login/ sin sesion."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
         return Client()
 
-    def test_module_list_redirects_to_login(self, client):
-        """GET /fleet/modules/ sin sesion redirige a login."""
-        response = client.get("/fleet/modules/")
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
-
-    def test_module_detail_redirects_to_login(self, client):
-        """GET /fleet/modules/M01/ sin sesion redirige a login."""
-        response = client.get("/fleet/modules/M01/")
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
-
-    def test_projection_grid_redirects_to_login(self, client):
-        """GET /fleet/planner/ sin sesion redirige a login."""
-        response = client.get("/fleet/planner/")
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
-
-    def test_projection_export_redirects_to_login(self, client):
-        """GET /fleet/planner/export/ sin sesion redirige a login."""
-        response = client.get("/fleet/planner/export/")
-        assert response.status_code == 302
-        assert "/accounts/login/" in response.url
-
-    def test_sync_status_redirects_to_login(self, client):
-        """GET /fleet/sync/status/ sin sesion redirige a login."""
-        response = client.get("/fleet/sync/status/")
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/fleet/modules/",
+            "/fleet/modules/M01/",
+            "/fleet/planner/",
+            "/fleet/planner/export/",
+            "/fleet/sync/status/",
+        ],
+    )
+    def test_protected_view_redirects_to_login(self, client, url):
+        """GET a una vista protegida sin sesion redirige a login."""
+        response = client.get(url)
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
@@ -69,20 +61,20 @@ class TestAuthenticatedAccess:
 
     @pytest.fixture
     def authenticated_client(self):
-        User.objects.create_user(
+        user = User.objects.create_user(
             username="analista",
             password="testpass123!",
             email="analista@trenesargentinos.gob.ar",
         )
         client = Client()
-        client.login(username="analista", password="testpass123!")
+        client.force_login(user)
         return client
 
     @pytest.fixture
-    def mock_stub_data(self):
+    def mock_stub_data(self, stub_modules):
         with patch(
             "web.fleet.views.get_modules_with_fallback",
-            return_value=get_all_modules(),
+            new=lambda: stub_modules,
         ):
             yield
 
@@ -137,7 +129,7 @@ class TestLoginFlow:
 
     def test_logout_redirects_to_login(self, client, user):
         """POST /accounts/logout/ redirige al login."""
-        client.login(username="analista", password="testpass123!")
+        client.force_login(user)
         response = client.post("/accounts/logout/")
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
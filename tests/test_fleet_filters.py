@@ -0,0 +1,32 @@
+"""
+Tests for fleet template filters.
+
+Tests cover:
+- euro_number: European thousands separator formatting
+"""
+
+import pytest
+
+from web.fleet.templatetags.fleet_filters import euro_number
+
+
+class TestEuroNumber:
+    """Tests for the euro_number filter."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (13826, "13.826"),
+            (1294221, "1.294.221"),
+            (0, "0"),
+            (999, "999"),
+            (-1234, "-1.234"),
+            (1234.9, "1.234"),
+            ("5000", "5.000"),
+            (None, "0"),
+            ("n/a", "n/a"),
+        ],
+    )
+    def test_formats_with_dot_separator(self, value, expected):
+        """Numbers get dots as thousands separators; bad input passes through."""
+        assert euro_number(value) == expected
@@ -6,88 +6,157 @@ Tests cover:
 - Module list view provides correct context
 - Fleet filtering by CSR/Toshiba
 - Module detail view with projection and key data
+- Module detail after the planner on a shared (cached) module list
+- Planner modules_data builder shared by grid and export
+- Planner Excel export workbook contents and HTTP caching headers
+- Sync status polling endpoint and its short-lived cache
 """
 
+import json
+from dataclasses import fields
+from functools import lru_cache
+from datetime import date
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
+from django.contrib.auth.models import User
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import timezone
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Alignment
+
+from etl.extractors.postgres_extractor import invalidate_postgres_staging_availability
+from infrastructure.database.models import StgModulo, StgOtSimaf, SyncLog
+from web.fleet.stub_data import ModuleData, get_all_modules
+from web.fleet.views import (
+    _build_modules_data,
+    _EXPORT_STYLES,
+    _cycle_style,
+    _styled_cell,
+    invalidate_sync_status_cache,
+    module_detail,
+    module_list,
+    projection_export,
+    projection_grid,
+    sync_status,
+)
+
+LIST_URL = reverse("fleet:module_list")
+DETAIL_URL_M01 = reverse("fleet:module_detail", args=["M01"])
+DETAIL_URL_T04 = reverse("fleet:module_detail", args=["T04"])
+
+
+@lru_cache(maxsize=1)
+def _stub_modules() -> tuple[ModuleData, ...]:
+    """Build the stub dataset once, frozen so no test can reorder or resize it."""
+    return tuple(get_all_modules())
+
+
+@pytest.fixture(scope="module")
+def mock_stub_data():
+    """
+    Mock the data source to use stub data.
+    
+    This ensures tests are deterministic and don't depend on
+    the Access database being available. The patch is applied once
+    per module; views only read the stub modules, so they can be shared.
+    """
+    stub_list = list(_stub_modules())
+    # new= swaps in a plain function: no MagicMock call recording per request
+    with patch(
+        "web.fleet.views.get_modules_with_fallback",
+        new=lambda: stub_list,
+    ):
+        yield
+
+
+@pytest.fixture
+def analyst():
+    """Unsaved user: enough for login_required on direct view calls."""
+    return User(username="analista")
+
+
+def _call_view(rf, user, view, path, data=None, **kwargs):
+    """Call a view directly through RequestFactory (no middleware, no rendering)."""
+    request = rf.get(path, data)
+    request.user = user
+    return view(request, **kwargs)
+
 
-from web.fleet.stub_data import get_all_modules
+@pytest.fixture(scope="module")
+def m01_detail(mock_stub_data):
+    """module_detail response for M01, computed once and shared by the module."""
+    return _call_view(
+        RequestFactory(), User(username="analista"), module_detail,
+        DETAIL_URL_M01, module_id="M01",
+    )
+
+
+@pytest.fixture(scope="module")
+def t04_detail(mock_stub_data):
+    """module_detail response for T04, computed once and shared by the module."""
+    return _call_view(
+        RequestFactory(), User(username="analista"), module_detail,
+        DETAIL_URL_T04, module_id="T04",
+    )
 
 
 @pytest.mark.django_db
 class TestModuleListView:
     """Tests for the module_list view."""
 
-    @pytest.fixture
-    def mock_stub_data(self):
-        """
-        Mock the data source to use stub data.
-        
-        This ensures tests are deterministic and don't depend on
-        the Access database being available.
-        """
-        with patch(
-            "web.fleet.views.get_modules_with_fallback",
-            return_value=get_all_modules()
-        ):
-            yield
-
     def test_view_returns_200(self, authenticated_client, mock_stub_data):
         """Module list view should return HTTP 200."""
-        response = authenticated_client.get("/fleet/modules/")
+        response = authenticated_client.get(LIST_URL)
         assert response.status_code == 200
 
     def test_view_uses_correct_template(self, authenticated_client, mock_stub_data):
         """View should use fleet/module_list.html template."""
-        response = authenticated_client.get("/fleet/modules/")
-        assert "fleet/module_list.html" in [t.name for t in response.templates]
+        response = authenticated_client.get(LIST_URL)
+        assert any(t.name == "fleet/module_list.html" for t in response.templates)
 
-    def test_context_contains_modules(self, authenticated_client, mock_stub_data):
+    def test_context_contains_modules(self, rf, analyst, mock_stub_data):
         """Context should contain 'modules' list with 110 modules (stub data, M67 excluded)."""
-        response = authenticated_client.get("/fleet/modules/")
-        assert "modules" in response.context
-        assert len(response.context["modules"]) == 110
+        response = _call_view(rf, analyst, module_list, LIST_URL)
+        assert "modules" in response.context_data
+        assert len(response.context_data["modules"]) == 110
 
-    def test_context_contains_summary(self, authenticated_client, mock_stub_data):
+    def test_context_contains_summary(self, rf, analyst, mock_stub_data):
         """Context should contain 'summary' dict with KPIs."""
-        response = authenticated_client.get("/fleet/modules/")
-        assert "summary" in response.context
+        response = _call_view(rf, analyst, module_list, LIST_URL)
+        assert "summary" in response.context_data
         
-        summary = response.context["summary"]
+        summary = response.context_data["summary"]
         assert summary["total_count"] == 110
         assert summary["csr_count"] == 85  # M67 excluded
         assert summary["toshiba_count"] == 25
 
-    def test_context_contains_fleet_filter(self, authenticated_client, mock_stub_data):
-        """Context should contain current fleet filter value."""
-        response = authenticated_client.get("/fleet/modules/")
-        assert "fleet_filter" in response.context
-        assert response.context["fleet_filter"] == "all"
-
-    def test_filter_by_csr(self, authenticated_client, mock_stub_data):
-        """Filtering by CSR should return only CSR modules (M67 excluded)."""
-        response = authenticated_client.get("/fleet/modules/?fleet=csr")
-        
-        assert response.context["fleet_filter"] == "csr"
-        modules = response.context["modules"]
-        assert len(modules) == 85  # M67 excluded
-        for module in modules:
-            assert module.fleet_type == "CSR"
-
-    def test_filter_by_toshiba(self, authenticated_client, mock_stub_data):
-        """Filtering by Toshiba should return only Toshiba modules."""
-        response = authenticated_client.get("/fleet/modules/?fleet=toshiba")
-        
-        assert response.context["fleet_filter"] == "toshiba"
-        modules = response.context["modules"]
-        assert len(modules) == 25
-        for module in modules:
-            assert module.fleet_type == "Toshiba"
+    @pytest.mark.parametrize(
+        "query,expected_filter,expected_count,expected_types",
+        [
+            ({}, "all", 110, {"CSR", "Toshiba"}),  # M67 excluded
+            ({"fleet": "csr"}, "csr", 85, {"CSR"}),  # M67 excluded
+            ({"fleet": "toshiba"}, "toshiba", 25, {"Toshiba"}),
+        ],
+        ids=["all", "csr", "toshiba"],
+    )
+    def test_fleet_filter(
+        self, rf, analyst, mock_stub_data,
+        query, expected_filter, expected_count, expected_types,
+    ):
+        """Fleet filter should be echoed in context and restrict the modules listed."""
+        response = _call_view(rf, analyst, module_list, LIST_URL, query)
+
+        assert response.context_data["fleet_filter"] == expected_filter
+        modules = response.context_data["modules"]
+        assert len(modules) == expected_count
+        assert {m.fleet_type for m in modules} == expected_types
 
     def test_only_get_method_allowed(self, authenticated_client):
         """View should only allow GET requests."""
-        response = authenticated_client.post("/fleet/modules/")
+        response = authenticated_client.post(LIST_URL)
         assert response.status_code == 405  # Method Not Allowed
 
 
@@ -97,135 +166,407 @@ class TestModuleListViewWithRealData:
     Integration tests that use real data source.
     
     These tests verify the view works with whatever data is available,
-    without checking specific counts.
+    without checking specific counts. The view is called directly and
+    its TemplateResponse is never rendered.
     """
 
-    def test_view_returns_modules_list(self, authenticated_client):
+    def test_view_returns_modules_list(self, rf, analyst):
         """View should return a non-empty list of modules."""
-        response = authenticated_client.get("/fleet/modules/")
-        modules = response.context["modules"]
+        response = _call_view(rf, analyst, module_list, LIST_URL)
+        modules = response.context_data["modules"]
         
         # Should have some modules (either from Access or stub)
         assert len(modules) > 0
         
-    def test_all_modules_have_required_attributes(self, authenticated_client):
+    def test_all_modules_have_required_attributes(self, rf, analyst):
         """All modules should have the required attributes."""
-        response = authenticated_client.get("/fleet/modules/")
-        modules = response.context["modules"]
+        response = _call_view(rf, analyst, module_list, LIST_URL)
+        modules = response.context_data["modules"]
         
-        for module in modules:
-            assert hasattr(module, "module_id")
-            assert hasattr(module, "fleet_type")
-            assert hasattr(module, "km_total_accumulated")
-            assert hasattr(module, "last_maintenance_date")
+        # Every module is built from the same dataclass, so checking the
+        # set of types plus the dataclass fields covers the whole list.
+        assert {type(m) for m in modules} == {ModuleData}
+        required = {"module_id", "fleet_type", "km_total_accumulated", "last_maintenance_date"}
+        assert required <= {f.name for f in fields(ModuleData)}
 
-    def test_summary_has_required_keys(self, authenticated_client):
+    def test_summary_has_required_keys(self, rf, analyst):
         """Summary should contain all required KPI keys."""
-        response = authenticated_client.get("/fleet/modules/")
-        summary = response.context["summary"]
+        response = _call_view(rf, analyst, module_list, LIST_URL)
+        summary = response.context_data["summary"]
         
-        required_keys = [
+        required_keys = {
             "csr_count", "toshiba_count", "total_count",
             "csr_km_month", "toshiba_km_month", "total_km_month",
             "csr_km_total", "toshiba_km_total", "total_km_total",
-        ]
-        for key in required_keys:
-            assert key in summary
+        }
+        assert required_keys <= summary.keys()
 
 
-@pytest.mark.django_db
 class TestModuleDetailView:
-    """Tests for the module_detail view."""
-
-    @pytest.fixture
-    def mock_stub_data(self):
-        """Mock data source to use stub data."""
-        with patch(
-            "web.fleet.views.get_modules_with_fallback",
-            return_value=get_all_modules()
-        ):
-            yield
-
-    def test_detail_returns_200_for_csr(self, authenticated_client, mock_stub_data):
-        """Detail view should return 200 for a valid CSR module."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        assert response.status_code == 200
+    """Tests for the module_detail view.
 
-    def test_detail_returns_200_for_toshiba(self, authenticated_client, mock_stub_data):
-        """Detail view should return 200 for a valid Toshiba module (real ID)."""
-        response = authenticated_client.get("/fleet/modules/T04/")
-        assert response.status_code == 200
-
-    def test_detail_returns_404_for_invalid(self, authenticated_client, mock_stub_data):
-        """Detail view should return 404 for non-existent module."""
-        response = authenticated_client.get("/fleet/modules/X99/")
-        assert response.status_code == 404
-
-    def test_detail_case_insensitive(self, authenticated_client, mock_stub_data):
-        """Module ID should be case-insensitive."""
-        response = authenticated_client.get("/fleet/modules/m01/")
-        assert response.status_code == 200
+    Context tests call the view directly with stub data and never touch
+    the ORM; only tests that log in through the Client need the database.
+    """
 
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "module_id,expected_status",
+        [
+            ("M01", 200),  # valid CSR module
+            ("T04", 200),  # valid Toshiba module (real ID)
+            ("m01", 200),  # module ID is case-insensitive
+            ("X99", 404),  # non-existent module
+        ],
+    )
+    def test_detail_status_code(
+        self, authenticated_client, mock_stub_data, module_id, expected_status
+    ):
+        """Detail view should return 200 for valid modules and 404 otherwise."""
+        response = authenticated_client.get(reverse("fleet:module_detail", args=[module_id]))
+        assert response.status_code == expected_status
+
+    @pytest.mark.django_db
     def test_detail_uses_correct_template(self, authenticated_client, mock_stub_data):
         """Should use fleet/module_detail.html template."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        template_names = [t.name for t in response.templates]
-        assert "fleet/module_detail.html" in template_names
+        response = authenticated_client.get(DETAIL_URL_M01)
+        assert any(t.name == "fleet/module_detail.html" for t in response.templates)
 
-    def test_detail_context_has_module(self, authenticated_client, mock_stub_data):
+    def test_detail_context_has_module(self, m01_detail):
         """Context should contain the module object."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        assert "module" in response.context
-        module = response.context["module"]
+        context = m01_detail.context_data
+        assert "module" in context
+        module = context["module"]
         assert module.module_id == "M01"
         assert module.fleet_type == "CSR"
 
-    def test_detail_context_has_projection(self, authenticated_client, mock_stub_data):
+    def test_detail_context_has_projection(self, m01_detail):
         """Context should contain a projection result."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        assert "projection" in response.context
-        projection = response.context["projection"]
+        context = m01_detail.context_data
+        assert "projection" in context
+        projection = context["projection"]
         # With stub data, projection should be computed
         assert projection is not None
         assert hasattr(projection, "cycle_type")
         assert hasattr(projection, "km_remaining")
         assert hasattr(projection, "estimated_date")
 
-    def test_detail_context_has_module_options(self, authenticated_client, mock_stub_data):
+    def test_detail_context_has_module_options(self, m01_detail):
         """Context should contain module_options for the dropdown."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        assert "module_options" in response.context
-        options = response.context["module_options"]
+        context = m01_detail.context_data
+        assert "module_options" in context
+        options = context["module_options"]
         assert len(options) == 110  # 85 CSR + 25 Toshiba (M67 excluded)
 
-    def test_detail_module_has_key_data(self, authenticated_client, mock_stub_data):
+    def test_detail_module_has_key_data(self, m01_detail):
         """Module should have maintenance_key_data populated."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        module = response.context["module"]
+        context = m01_detail.context_data
+        module = context["module"]
         assert len(module.maintenance_key_data) > 0
         # CSR should have 4 cycle types
         assert len(module.maintenance_key_data) == 4
 
-    def test_detail_toshiba_has_key_data(self, authenticated_client, mock_stub_data):
+    def test_detail_toshiba_has_key_data(self, t04_detail):
         """Toshiba module should have 2 key data entries (RB, RG)."""
-        response = authenticated_client.get("/fleet/modules/T04/")
-        module = response.context["module"]
+        context = t04_detail.context_data
+        module = context["module"]
         assert len(module.maintenance_key_data) == 2
 
-    def test_detail_module_has_history(self, authenticated_client, mock_stub_data):
+    def test_detail_module_has_history(self, m01_detail):
         """Module should have maintenance_history populated."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        module = response.context["module"]
+        context = m01_detail.context_data
+        module = context["module"]
         assert len(module.maintenance_history) > 0
 
-    def test_detail_context_has_data_source(self, authenticated_client, mock_stub_data):
+    def test_detail_context_has_data_source(self, m01_detail):
         """Context should contain data_source indicator."""
-        response = authenticated_client.get("/fleet/modules/M01/")
-        assert "data_source" in response.context
+        context = m01_detail.context_data
+        assert "data_source" in context
         # With stub data, module_db_id is None, so source is STUB
-        assert response.context["data_source"] == "STUB"
+        assert context["data_source"] == "STUB"
 
+    @pytest.mark.django_db
     def test_detail_only_get_allowed(self, authenticated_client):
         """Detail view should only allow GET requests."""
-        response = authenticated_client.post("/fleet/modules/M01/")
+        response = authenticated_client.post(DETAIL_URL_M01)
         assert response.status_code == 405
+
+
+
+@pytest.mark.django_db
+class TestDetailAfterPlanner:
+    """module_detail on a module list shared with the planner views.
+
+    get_modules_with_fallback() returns the same cached ModuleData objects
+    to every request, so per-request detail must not leak between views.
+    """
+
+    @pytest.fixture
+    def shared_modules(self):
+        """One staging-backed module served as the cached module list."""
+        StgModulo.objects.create(access_id=1, nombre="M50")
+        StgOtSimaf.objects.create(
+            modulo_access_id=1, tarea="IQ", km=480_000,
+            fecha_inicio=date(2025, 2, 27), fecha_fin=date(2025, 3, 1),
+        )
+        invalidate_postgres_staging_availability()
+        modules = [ModuleData(
+            module_id="M50",
+            module_number=50,
+            fleet_type="CSR",
+            configuration="tripla",
+            coach_count=3,
+            km_current_month=0,
+            km_total_accumulated=500_000,
+            last_maintenance_date=date(2025, 3, 1),
+            last_maintenance_type="IQ",
+            km_at_last_maintenance=480_000,
+            module_db_id=1,
+            reference_date=date(2015, 5, 20),
+        )]
+        with patch("web.fleet.views.get_modules_with_fallback", new=lambda: modules):
+            yield modules
+        invalidate_postgres_staging_availability()
+
+    def test_detail_after_planner_loads_history(self, rf, analyst, shared_modules):
+        """Opening the planner first must not leave the detail page without history."""
+        _call_view(rf, analyst, projection_grid, "/fleet/planner/", {"fleet": "csr"})
+        response = _call_view(
+            rf, analyst, module_detail, "/fleet/modules/M50/", module_id="M50",
+        )
+
+        module = response.context_data["module"]
+        assert [e.task_type for e in module.maintenance_history] == ["IQ"]
+        assert module.maintenance_key_data
+        # The detail lives on a per-request copy, not on the cached object
+        assert module is not shared_modules[0]
+        assert not shared_modules[0].maintenance_history
+
+    def test_planner_leaves_cached_modules_untouched(self, shared_modules):
+        """Key data loaded for the planner only goes into modules_data."""
+        fleet_modules, modules_data = _build_modules_data("CSR")
+
+        assert fleet_modules == shared_modules
+        assert {kd["cycle_type"] for kd in modules_data[0]["key_data"]} >= {"IQ"}
+        assert not shared_modules[0].maintenance_key_data
+
+
+class TestBuildModulesData:
+    """Tests for the modules_data builder shared by the planner views."""
+
+    @pytest.mark.parametrize("fleet_type,count", [("CSR", 85), ("Toshiba", 25)])
+    def test_filters_by_fleet(self, mock_stub_data, fleet_type, count):
+        """Only modules of the requested fleet are returned, in both lists."""
+        fleet_modules, modules_data = _build_modules_data(fleet_type)
+
+        assert len(fleet_modules) == len(modules_data) == count
+        assert {m["fleet_type"] for m in modules_data} == {fleet_type}
+        assert [m["module_id"] for m in modules_data] == [
+            m.module_id for m in fleet_modules
+        ]
+
+    def test_key_data_converted_to_dicts(self, mock_stub_data):
+        """Key data is flattened to the dicts GridProjectionService expects."""
+        fleet_modules, modules_data = _build_modules_data("CSR")
+
+        kd = fleet_modules[0].maintenance_key_data[0]
+        assert modules_data[0]["key_data"][0] == {
+            "cycle_type": kd.cycle_type,
+            "cycle_km": kd.cycle_km,
+            "km_since": kd.km_since,
+            "last_date": kd.last_date,
+        }
+
+
+class TestProjectionExport:
+    """Tests for the planner Excel export."""
+
+    @pytest.fixture(scope="class")
+    def csr_sheet(self, django_db_setup, django_db_blocker, mock_stub_data):
+        """Worksheet exported for CSR, 6 months, with one DA intervention on M01.
+
+        The export reads SyncLog for its ETag, hence the (read-only) DB access.
+        """
+        with django_db_blocker.unblock():
+            response = _call_view(
+                RequestFactory(), User(username="analista"), projection_export,
+                "/fleet/planner/export/",
+                {"fleet": "csr", "months": 6, "interventions": '["M01-DA-2"]'},
+            )
+        assert response["Content-Type"] == (
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        )
+        return load_workbook(BytesIO(response.content)).active
+
+    def test_header_row(self, csr_sheet):
+        """Header has the four fixed columns followed by one per month."""
+        header = [c.value for c in csr_sheet[1]]
+        assert header[:4] == ["Modulo", "Fecha", "Ciclo", "Umbral"]
+        assert len(header) == 4 + 6
+        assert csr_sheet["A1"].font.b
+
+    def test_sheet_layout(self, csr_sheet):
+        """Title, frozen panes and the merged module cell are preserved."""
+        assert csr_sheet.title == "Proyeccion CSR"
+        assert csr_sheet.freeze_panes == "E2"
+        assert csr_sheet["A2"].value == "M01"
+        assert "A2:A5" in {str(r) for r in csr_sheet.merged_cells.ranges}
+
+    def test_intervention_marked_with_cycle_fill(self, csr_sheet):
+        """The intervention cell shows the cycle code on the DA fill colour."""
+        da_row = next(
+            row for row in csr_sheet.iter_rows(min_row=2, max_row=5)
+            if row[2].value == "DA"
+        )
+        cell = da_row[4 + 2]
+        assert cell.value == "DA"
+        assert cell.fill.fgColor.rgb.endswith("FEE2E2")
+
+    def test_module_and_data_cell_styles(self, csr_sheet):
+        """Every module cell keeps the merged alignment; km cells stay plain."""
+        module_cells = [
+            c for c in csr_sheet["A"][1:]
+            if isinstance(c.value, str) and c.value.startswith("M")
+        ]
+        assert len(module_cells) > 1
+        for cell in module_cells:
+            assert cell.font.b
+            assert (cell.alignment.horizontal, cell.alignment.vertical) == ("center", "center")
+
+        threshold = csr_sheet["D3"]
+        assert threshold.alignment.horizontal == "right"
+        assert threshold.number_format == "#,##0"
+        assert not threshold.font.b
+
+    def test_control_row_counts_interventions(self, csr_sheet):
+        """The Control summary row totals interventions per month."""
+        control = next(
+            row for row in csr_sheet.iter_rows() if row[2].value == "Control"
+        )
+        assert [c.value for c in control[4:]] == [0, 0, 1, 0, 0, 0]
+
+
+
+class TestStyledCell:
+    """Tests for the export's style-table write-only cell helper."""
+
+    def test_shared_styles_saved_independently(self):
+        """Cells built from one style entry keep it in the saved file, even if one is restyled."""
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("t")
+        km_style = _EXPORT_STYLES["km"]
+
+        first = _styled_cell(ws, 1, km_style)
+        second = _styled_cell(ws, 2, km_style)
+        first.alignment = Alignment(horizontal="left")
+        mark = _styled_cell(ws, "DA", _cycle_style("DA", "mark"))
+        plain = _styled_cell(ws, 4)
+        ws.append([first, second, mark, plain])
+
+        buf = BytesIO()
+        wb.save(buf)
+        row = next(load_workbook(buf).active.iter_rows())
+
+        assert row[0].alignment.horizontal == "left"
+        assert row[1].alignment.horizontal == "right"
+        assert row[1].number_format == "#,##0"
+        assert km_style["alignment"].horizontal == "right"
+        assert row[2].font.b
+        assert row[2].fill.fgColor.rgb.endswith("FEE2E2")
+        assert row[2].alignment.horizontal == "center"
+        assert not row[3].font.b
+        assert row[3].alignment.horizontal is None
+
+    def test_unstyled_cycle_falls_back(self):
+        """Cycles without export colours get the plain style for the role."""
+        assert _cycle_style("XX", "exceeded") is _EXPORT_STYLES["km"]
+        assert _cycle_style("XX", "count") is _EXPORT_STYLES["center"]
+
+
+@pytest.mark.django_db
+class TestProjectionExportCaching:
+    """Tests for the planner export's Cache-Control and ETag handling."""
+
+    EXPORT_PARAMS = {"fleet": "toshiba", "months": 3}
+
+    @pytest.fixture(autouse=True)
+    def _fresh_staging_flag(self):
+        """Each test re-checks whether staging data exists."""
+        invalidate_postgres_staging_availability()
+        yield
+        invalidate_postgres_staging_availability()
+
+    def _export(self, rf, analyst, **headers):
+        request = rf.get("/fleet/planner/export/", self.EXPORT_PARAMS, **headers)
+        request.user = analyst
+        return projection_export(request)
+
+    def test_no_etag_without_synced_data(self, rf, analyst, mock_stub_data):
+        """Stub/live data has no sync version, so no ETag is sent."""
+        response = self._export(rf, analyst)
+        assert response.status_code == 200
+        assert not response.has_header("ETag")
+        assert "private" in response["Cache-Control"]
+
+    def test_not_modified_for_matching_etag(self, rf, analyst, mock_stub_data):
+        """With synced staging data a repeated request gets 304 Not Modified."""
+        SyncLog.objects.create(started_at=timezone.now(), status="success")
+        StgModulo.objects.create(access_id=1, nombre="T04")
+
+        etag = self._export(rf, analyst)["ETag"]
+        response = self._export(rf, analyst, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+
+    def test_new_sync_changes_etag(self, rf, analyst, mock_stub_data):
+        """A new SyncLog row yields a new ETag, so the old one no longer matches."""
+        SyncLog.objects.create(started_at=timezone.now(), status="success")
+        StgModulo.objects.create(access_id=1, nombre="T04")
+        old_etag = self._export(rf, analyst)["ETag"]
+
+        SyncLog.objects.create(started_at=timezone.now(), status="running")
+        response = self._export(rf, analyst, HTTP_IF_NONE_MATCH=old_etag)
+
+        assert response.status_code == 200
+        assert response["ETag"] != old_etag
+
+
+@pytest.mark.django_db
+class TestSyncStatusView:
+    """Tests for the sync_status polling endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        """Each test starts and ends without a cached payload."""
+        invalidate_sync_status_cache()
+        yield
+        invalidate_sync_status_cache()
+
+    def _status(self, rf, analyst) -> dict:
+        return json.loads(_call_view(rf, analyst, sync_status, "/fleet/sync/status/").content)
+
+    def test_never_synced(self, rf, analyst):
+        """Without SyncLog rows the status is 'never'."""
+        payload = self._status(rf, analyst)
+        assert payload["has_synced"] is False
+        assert payload["status"] == "never"
+
+    def test_latest_sync_reported(self, rf, analyst):
+        """The most recent SyncLog row is reported."""
+        SyncLog.objects.create(
+            started_at=timezone.now(), status="success", tables_synced={"modulos": 3},
+        )
+        payload = self._status(rf, analyst)
+        assert payload["has_synced"] is True
+        assert payload["status"] == "success"
+        assert payload["tables"] == {"modulos": 3}
+
+    def test_cached_until_invalidated(self, rf, analyst):
+        """Polls inside the TTL reuse the payload until the cache is invalidated."""
+        assert self._status(rf, analyst)["status"] == "never"
+
+        SyncLog.objects.create(started_at=timezone.now(), status="running")
+        assert self._status(rf, analyst)["status"] == "never"
+
+        invalidate_sync_status_cache()
+        assert self._status(rf, analyst)["status"] == "running"
@@ -11,6 +11,8 @@ Tests cover:
 
 from datetime import date
 
+import pytest
+
 from core.services.grid_projection import (
     DEFAULT_MONTHS,
     DEFAULT_AVG_MONTHLY_KM,
@@ -22,6 +24,94 @@ from core.services.grid_projection import (
 )
 
 
+# Reference ("today") dates shared by the projection tests
+REF_FEB1 = date(2026, 2, 1)
+REF_FEB11 = date(2026, 2, 11)
+REF_FEB15 = date(2026, 2, 15)
+REF_2020 = date(2020, 1, 1)
+
+# Last intervention dates used by the last_date propagation tests
+LAST_AN = date(2024, 6, 15)
+LAST_PE = date(2021, 12, 1)
+LAST_DA = date(2018, 8, 20)
+
+# key_data payloads are built once and never mutated by the service;
+# tests pass ``list(...)`` copies to match the ``list[dict]`` signature.
+_CSR_KEY_DATA = (
+    {"cycle_type": "AN", "cycle_km": 187_500, "km_since": 50_000},
+    {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 100_000},
+    {"cycle_type": "PE", "cycle_km": 750_000, "km_since": 200_000},
+    {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 300_000},
+)
+
+_CSR_M02_KEY_DATA = (
+    {"cycle_type": "AN", "cycle_km": 187_500, "km_since": 10_000},
+    {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 20_000},
+    {"cycle_type": "PE", "cycle_km": 750_000, "km_since": 40_000},
+    {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 80_000},
+)
+
+_TOSHIBA_KEY_DATA = (
+    {"cycle_type": "RB", "cycle_km": 300_000, "km_since": 50_000},
+    {"cycle_type": "RG", "cycle_km": 600_000, "km_since": 100_000},
+)
+
+
+def _with_last_dates(last_dates: dict[str, date]) -> list[dict]:
+    """CSR key_data with ``last_date`` set on the given cycles only.
+
+    Only the affected entries are shallow-copied; the rest are shared.
+    """
+    return [
+        {**entry, "last_date": last_dates[entry["cycle_type"]]}
+        if entry["cycle_type"] in last_dates else entry
+        for entry in _CSR_KEY_DATA
+    ]
+
+
+@pytest.fixture(scope="module")
+def csr_module_18m():
+    """18-month projection of a CSR module, computed once and shared by the module."""
+    return GridProjectionService.project_module(
+        module_id="M01",
+        fleet_type="CSR",
+        key_data=list(_CSR_KEY_DATA),
+        avg_monthly_km=12_000,
+        months=18,
+        reference_date=REF_FEB1,
+    )
+
+
+@pytest.fixture(scope="session")
+def csr_86_modules():
+    """Ranking input for a full CSR fleet, built once per session."""
+    return tuple(
+        {
+            "module_id": f"M{i:02d}",
+            "fleet_type": "CSR",
+            "km_since_reference": 1_000_000 - i * 10_000,
+            "reference_date": REF_2020,
+            "reference_type": "RG",
+        }
+        for i in range(86)
+    )
+
+
+@pytest.fixture(scope="session")
+def csr_5_modules():
+    """Ranking input for five CSR modules, built once per session."""
+    return tuple(
+        {
+            "module_id": f"M{i:02d}",
+            "fleet_type": "CSR",
+            "km_since_reference": 500_000 - i * 50_000,
+            "reference_date": REF_2020,
+            "reference_type": "RG",
+        }
+        for i in range(5)
+    )
+
+
 class TestConstants:
     """Verify default constants are correctly defined."""
 
@@ -32,147 +122,83 @@ class TestConstants:
         assert DEFAULT_AVG_MONTHLY_KM["CSR"] == 12_000
         assert DEFAULT_AVG_MONTHLY_KM["Toshiba"] == 8_000
 
-    def test_cycle_colors_csr(self):
-        assert "AN" in CYCLE_COLORS
-        assert "BA" in CYCLE_COLORS
-        assert "PE" in CYCLE_COLORS
-        assert "DA" in CYCLE_COLORS
-        # Each color has bg and text keys
-        for cycle in ("AN", "BA", "PE", "DA"):
-            assert "bg" in CYCLE_COLORS[cycle]
-            assert "text" in CYCLE_COLORS[cycle]
-
-    def test_cycle_colors_toshiba(self):
-        assert "RB" in CYCLE_COLORS
-        assert "RG" in CYCLE_COLORS
+    @pytest.mark.parametrize(
+        "cycle", ["AN", "BA", "PE", "DA", "RB", "RG"],
+    )
+    def test_cycle_colors(self, cycle):
+        """Each heavy cycle (CSR and Toshiba) has bg and text colour classes."""
+        assert "bg" in CYCLE_COLORS[cycle]
+        assert "text" in CYCLE_COLORS[cycle]
 
 
 class TestProjectSingleCycle:
     """Test projection of a single cycle for a single module."""
 
-    def test_basic_projection_18_months(self):
-        """Should project km accumulation for 18 months."""
+    @pytest.mark.parametrize(
+        "km_since,months,reference_date,expect",
+        [
+            # Reference is start of month, so the first month adds the full 12k
+            (
+                50_000, 18, REF_FEB1,
+                lambda r: len(r) == 18
+                and all(isinstance(m, MonthProjection) for m in r),
+            ),
+            # Feb 11, 2026 -> 18 of 28 days remaining (11th included): 12000 / 28 * 18 ≈ 7714
+            (
+                100_000, 3, REF_FEB11,
+                lambda r: r[0].km_accumulated
+                == pytest.approx(100_000 + 12_000 / 28 * 18, abs=1),
+            ),
+            # Second and subsequent months add the full avg_monthly_km
+            (
+                100_000, 3, REF_FEB1,
+                lambda r: r[1].km_accumulated - r[0].km_accumulated == 12_000,
+            ),
+            # Month 1: 180k + 12k = 192k > 187.5k -> exceeded
+            (180_000, 3, REF_FEB1, lambda r: r[0].exceeded is True),
+            # Month 1: 10k + 12k = 22k < 187.5k
+            (10_000, 2, REF_FEB1, lambda r: r[0].exceeded is False),
+            (
+                0, 3, REF_FEB15,
+                lambda r: [m.month_label for m in r] == ["Feb-26", "Mar-26", "Apr-26"],
+            ),
+            # Fresh after intervention
+            (
+                0, 2, REF_FEB1,
+                lambda r: r[0].km_accumulated == 12_000 and r[0].exceeded is False,
+            ),
+            # No data available: None is treated as 0
+            (None, 2, REF_FEB1, lambda r: r[0].km_accumulated == 12_000),
+        ],
+        ids=[
+            "basic_projection_18_months",
+            "prorated_current_month",
+            "second_month_adds_full_km",
+            "exceeded_flag_set_when_threshold_reached",
+            "not_exceeded_when_within_threshold",
+            "month_labels_format",
+            "zero_km_since",
+            "none_km_since_treated_as_zero",
+        ],
+    )
+    def test_project_cycle(self, km_since, months, reference_date, expect):
+        """project_cycle with a 187 500 km cycle and 12 000 km/month."""
         result = GridProjectionService.project_cycle(
-            km_since=50_000,
+            km_since=km_since,
             cycle_km=187_500,
             avg_monthly_km=12_000,
-            months=18,
-            reference_date=date(2026, 2, 1),  # Start of month for simplicity
-        )
-        assert len(result) == 18
-        # First month: full 12k since reference is start of month
-        # km_since starts at 50k, so first month ~50k + prorated
-        assert all(isinstance(m, MonthProjection) for m in result)
-
-    def test_prorated_current_month(self):
-        """Current month should only add km for remaining days."""
-        # Feb 11, 2026 -> 17 days remaining in Feb (28 days)
-        result = GridProjectionService.project_cycle(
-            km_since=100_000,
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=3,
-            reference_date=date(2026, 2, 11),
+            months=months,
+            reference_date=reference_date,
         )
-        first = result[0]
-        # Prorated: 12000 / 28 * 17 ≈ 7286 (approx)
-        # So km_accumulated ≈ 100_000 + 7_286 = 107_286
-        assert first.km_accumulated > 100_000
-        assert first.km_accumulated < 100_000 + 12_000  # Less than full month
-
-    def test_second_month_adds_full_km(self):
-        """Second and subsequent months should add full avg_monthly_km."""
-        result = GridProjectionService.project_cycle(
-            km_since=100_000,
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=3,
-            reference_date=date(2026, 2, 1),
-        )
-        # Difference between month 2 and month 1 should be 12_000
-        diff = result[1].km_accumulated - result[0].km_accumulated
-        assert diff == 12_000
-
-    def test_exceeded_flag_set_when_threshold_reached(self):
-        """exceeded should be True when km_accumulated >= cycle_km."""
-        result = GridProjectionService.project_cycle(
-            km_since=180_000,  # Close to 187_500
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=3,
-            reference_date=date(2026, 2, 1),
-        )
-        # Month 1: 180k + 12k = 192k > 187.5k -> exceeded
-        assert result[0].exceeded is True
-
-    def test_not_exceeded_when_within_threshold(self):
-        """exceeded should be False when km_accumulated < cycle_km."""
-        result = GridProjectionService.project_cycle(
-            km_since=10_000,
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=2,
-            reference_date=date(2026, 2, 1),
-        )
-        # Month 1: 10k + 12k = 22k < 187.5k
-        assert result[0].exceeded is False
-
-    def test_month_labels_format(self):
-        """Each MonthProjection should have correct month_label."""
-        result = GridProjectionService.project_cycle(
-            km_since=0,
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=3,
-            reference_date=date(2026, 2, 15),
-        )
-        assert result[0].month_label == "Feb-26"
-        assert result[1].month_label == "Mar-26"
-        assert result[2].month_label == "Apr-26"
-
-    def test_zero_km_since(self):
-        """Should work when starting from 0 km (fresh after intervention)."""
-        result = GridProjectionService.project_cycle(
-            km_since=0,
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=2,
-            reference_date=date(2026, 2, 1),
-        )
-        assert result[0].km_accumulated == 12_000
-        assert result[0].exceeded is False
-
-    def test_none_km_since_treated_as_zero(self):
-        """When km_since is None, treat as 0 (no data available)."""
-        result = GridProjectionService.project_cycle(
-            km_since=None,
-            cycle_km=187_500,
-            avg_monthly_km=12_000,
-            months=2,
-            reference_date=date(2026, 2, 1),
-        )
-        assert result[0].km_accumulated == 12_000
+        assert expect(result)
 
 
 class TestProjectModule:
     """Test projection of all heavy cycles for a single module."""
 
-    def test_csr_module_returns_4_cycle_rows(self):
+    def test_csr_module_returns_4_cycle_rows(self, csr_module_18m):
         """CSR module should have 4 heavy cycle rows (AN, BA, PE, DA)."""
-        key_data = [
-            {"cycle_type": "AN", "cycle_km": 187_500, "km_since": 50_000},
-            {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 100_000},
-            {"cycle_type": "PE", "cycle_km": 750_000, "km_since": 200_000},
-            {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 300_000},
-        ]
-        result = GridProjectionService.project_module(
-            module_id="M01",
-            fleet_type="CSR",
-            key_data=key_data,
-            avg_monthly_km=12_000,
-            months=18,
-            reference_date=date(2026, 2, 1),
-        )
+        result = csr_module_18m
         assert isinstance(result, ModuleGridData)
         assert result.module_id == "M01"
         assert len(result.cycle_rows) == 4
@@ -182,17 +208,13 @@ class TestProjectModule:
 
     def test_toshiba_module_returns_2_cycle_rows(self):
         """Toshiba module should have 2 heavy cycle rows (RB, RG)."""
-        key_data = [
-            {"cycle_type": "RB", "cycle_km": 300_000, "km_since": 50_000},
-            {"cycle_type": "RG", "cycle_km": 600_000, "km_since": 100_000},
-        ]
         result = GridProjectionService.project_module(
             module_id="T01",
             fleet_type="Toshiba",
-            key_data=key_data,
+            key_data=list(_TOSHIBA_KEY_DATA),
             avg_monthly_km=8_000,
             months=18,
-            reference_date=date(2026, 2, 1),
+            reference_date=REF_FEB1,
         )
         assert len(result.cycle_rows) == 2
         # Descending hierarchy order: RG first, RB last
@@ -209,29 +231,19 @@ class TestGenerateGrid:
             {
                 "module_id": "M01",
                 "fleet_type": "CSR",
-                "key_data": [
-                    {"cycle_type": "AN", "cycle_km": 187_500, "km_since": 50_000},
-                    {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 100_000},
-                    {"cycle_type": "PE", "cycle_km": 750_000, "km_since": 200_000},
-                    {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 300_000},
-                ],
+                "key_data": list(_CSR_KEY_DATA),
             },
             {
                 "module_id": "M02",
                 "fleet_type": "CSR",
-                "key_data": [
-                    {"cycle_type": "AN", "cycle_km": 187_500, "km_since": 10_000},
-                    {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 20_000},
-                    {"cycle_type": "PE", "cycle_km": 750_000, "km_since": 40_000},
-                    {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 80_000},
-                ],
+                "key_data": list(_CSR_M02_KEY_DATA),
             },
         ]
         result = GridProjectionService.generate_grid(
             modules_data=modules_data,
             avg_monthly_km=12_000,
             months=6,
-            reference_date=date(2026, 2, 1),
+            reference_date=REF_FEB1,
         )
         assert len(result) == 2
         assert result[0].module_id == "M01"
@@ -241,9 +253,9 @@ class TestGenerateGrid:
         """Should return correct month headers."""
         headers = GridProjectionService.get_month_headers(
             months=3,
-            reference_date=date(2026, 2, 15),
+            reference_date=REF_FEB15,
         )
-        assert headers == ["Feb-26", "Mar-26", "Apr-26"]
+        assert headers == ("Feb-26", "Mar-26", "Apr-26")
 
     def test_grid_empty_input(self):
         """Should handle empty module list."""
@@ -251,7 +263,7 @@ class TestGenerateGrid:
             modules_data=[],
             avg_monthly_km=12_000,
             months=6,
-            reference_date=date(2026, 2, 1),
+            reference_date=REF_FEB1,
         )
         assert result == []
 
@@ -261,98 +273,49 @@ class TestCycleRowLastDate:
 
     def test_last_date_populated_from_key_data(self):
         """When key_data includes last_date, CycleRow should store it."""
-        key_data = [
-            {
-                "cycle_type": "AN",
-                "cycle_km": 187_500,
-                "km_since": 50_000,
-                "last_date": date(2024, 6, 15),
-            },
-            {
-                "cycle_type": "BA",
-                "cycle_km": 375_000,
-                "km_since": 100_000,
-                "last_date": date(2023, 3, 10),
-            },
-            {
-                "cycle_type": "PE",
-                "cycle_km": 750_000,
-                "km_since": 200_000,
-                "last_date": date(2021, 12, 1),
-            },
-            {
-                "cycle_type": "DA",
-                "cycle_km": 1_500_000,
-                "km_since": 300_000,
-                "last_date": date(2018, 8, 20),
-            },
-        ]
+        key_data = _with_last_dates({
+            "AN": LAST_AN,
+            "BA": date(2023, 3, 10),
+            "PE": LAST_PE,
+            "DA": LAST_DA,
+        })
         result = GridProjectionService.project_module(
             module_id="M01",
             fleet_type="CSR",
             key_data=key_data,
             avg_monthly_km=12_000,
             months=3,
-            reference_date=date(2026, 2, 1),
+            reference_date=REF_FEB1,
         )
         # DA is first (highest hierarchy)
-        assert result.cycle_rows[0].last_date == date(2018, 8, 20)
+        assert result.cycle_rows[0].last_date == LAST_DA
         # AN is last (lowest heavy hierarchy)
-        assert result.cycle_rows[-1].last_date == date(2024, 6, 15)
+        assert result.cycle_rows[-1].last_date == LAST_AN
 
-    def test_last_date_none_when_not_provided(self):
+    def test_last_date_none_when_not_provided(self, csr_module_18m):
         """When key_data omits last_date, CycleRow.last_date should be None."""
-        key_data = [
-            {"cycle_type": "AN", "cycle_km": 187_500, "km_since": 50_000},
-            {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 100_000},
-            {"cycle_type": "PE", "cycle_km": 750_000, "km_since": 200_000},
-            {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 300_000},
-        ]
-        result = GridProjectionService.project_module(
-            module_id="M01",
-            fleet_type="CSR",
-            key_data=key_data,
-            avg_monthly_km=12_000,
-            months=3,
-            reference_date=date(2026, 2, 1),
-        )
-        for row in result.cycle_rows:
+        for row in csr_module_18m.cycle_rows:
             assert row.last_date is None
 
     def test_last_date_mixed_some_provided(self):
         """last_date should be correct even when only some cycles have it."""
-        key_data = [
-            {
-                "cycle_type": "AN",
-                "cycle_km": 187_500,
-                "km_since": 50_000,
-                "last_date": date(2024, 6, 15),
-            },
-            {"cycle_type": "BA", "cycle_km": 375_000, "km_since": 100_000},
-            {
-                "cycle_type": "PE",
-                "cycle_km": 750_000,
-                "km_since": 200_000,
-                "last_date": date(2021, 12, 1),
-            },
-            {"cycle_type": "DA", "cycle_km": 1_500_000, "km_since": 300_000},
-        ]
+        key_data = _with_last_dates({"AN": LAST_AN, "PE": LAST_PE})
         result = GridProjectionService.project_module(
             module_id="M01",
             fleet_type="CSR",
             key_data=key_data,
             avg_monthly_km=12_000,
             months=3,
-            reference_date=date(2026, 2, 1),
+            reference_date=REF_FEB1,
         )
         # DA (index 0) has no last_date
         assert result.cycle_rows[0].last_date is None
         # PE (index 1) has last_date
-        assert result.cycle_rows[1].last_date == date(2021, 12, 1)
+        assert result.cycle_rows[1].last_date == LAST_PE
         # BA (index 2) has no last_date
         assert result.cycle_rows[2].last_date is None
         # AN (index 3) has last_date
-        assert result.cycle_rows[3].last_date == date(2024, 6, 15)
+        assert result.cycle_rows[3].last_date == LAST_AN
 
 
 class TestRankModulesByUrgency:
@@ -384,7 +347,7 @@ class TestRankModulesByUrgency:
                 "module_id": "M03",
                 "fleet_type": "CSR",
                 "km_since_reference": 500_000,
-                "reference_date": date(2020, 1, 1),
+                "reference_date": REF_2020,
                 "reference_type": "RG",
             },
         ]
@@ -393,19 +356,11 @@ class TestRankModulesByUrgency:
         assert result[1].module_id == "M01"
         assert result[2].module_id == "M03"
 
-    def test_returns_all_modules(self):
+    def test_returns_all_modules(self, csr_86_modules):
         """Debe retornar todos los modulos, sin limite."""
-        modules = [
-            {
-                "module_id": f"M{i:02d}",
-                "fleet_type": "CSR",
-                "km_since_reference": 1_000_000 - i * 10_000,
-                "reference_date": date(2020, 1, 1),
-                "reference_type": "RG",
-            }
-            for i in range(86)
-        ]
-        result = GridProjectionService.rank_modules_by_urgency(modules)
+        result = GridProjectionService.rank_modules_by_urgency(
+            list(csr_86_modules)
+        )
         assert len(result) == 86
 
     def test_modules_without_km_go_last(self):
@@ -422,7 +377,7 @@ class TestRankModulesByUrgency:
                 "module_id": "M02",
                 "fleet_type": "CSR",
                 "km_since_reference": 300_000,
-                "reference_date": date(2020, 1, 1),
+                "reference_date": REF_2020,
                 "reference_type": "RG",
             },
         ]
@@ -479,18 +434,10 @@ class TestRankModulesByUrgency:
         result = GridProjectionService.rank_modules_by_urgency(modules)
         assert len(result) == 2
 
-    def test_rank_field_is_1_indexed(self):
+    def test_rank_field_is_1_indexed(self, csr_5_modules):
         """El campo rank debe ser 1-indexed (1, 2, 3...)."""
-        modules = [
-            {
-                "module_id": f"M{i:02d}",
-                "fleet_type": "CSR",
-                "km_since_reference": 500_000 - i * 50_000,
-                "reference_date": date(2020, 1, 1),
-                "reference_type": "RG",
-            }
-            for i in range(5)
-        ]
-        result = GridProjectionService.rank_modules_by_urgency(modules)
+        result = GridProjectionService.rank_modules_by_urgency(
+            list(csr_5_modules)
+        )
         for i, entry in enumerate(result):
             assert entry.rank == i + 1
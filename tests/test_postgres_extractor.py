@@ -110,20 +110,22 @@ class TestDetermineConfiguration:
         assert config == "tripla"
         assert count == 3
 
-    def test_toshiba_cuadrupla(self):
+    # Known cuadruplas: 6, 11, 12, 16, 20, 24, 29, 31, 34, 39, 45, 52
+    @pytest.mark.parametrize(
+        "module_id",
+        [f"T{num:02d}" for num in [6, 11, 12, 16, 20, 24, 29, 31, 34, 39, 45, 52]],
+    )
+    def test_toshiba_cuadrupla(self, module_id):
         """Specific Toshiba modules are cuadruplas."""
-        # Known cuadruplas: 6, 11, 12, 16, 20, 24, 29, 31, 34, 39, 45, 52
-        for num in [6, 11, 12, 16, 20, 24, 29, 31, 34, 39, 45, 52]:
-            config, count = _determine_configuration(f"T{num:02d}", "Toshiba")
-            assert config == "cuadrupla", f"T{num:02d} should be cuadrupla"
-            assert count == 4
+        assert _determine_configuration(module_id, "Toshiba") == ("cuadrupla", 4)
 
-    def test_toshiba_tripla(self):
+    @pytest.mark.parametrize(
+        "module_id",
+        [f"T{num:02d}" for num in [1, 2, 3, 5, 7, 10, 15, 25, 30]],
+    )
+    def test_toshiba_tripla(self, module_id):
         """Other Toshiba modules are triplas."""
-        for num in [1, 2, 3, 5, 7, 10, 15, 25, 30]:
-            config, count = _determine_configuration(f"T{num:02d}", "Toshiba")
-            assert config == "tripla", f"T{num:02d} should be tripla"
-            assert count == 3
+        assert _determine_configuration(module_id, "Toshiba") == ("tripla", 3)
 
 
 class TestUbicacionToCoachType:
@@ -185,12 +187,52 @@ class TestPostgresExtractorIntegration:
     These tests require a Django test database with Stg* models.
     """
 
+    @pytest.fixture(autouse=True)
+    def _empty_staging(self):
+        """Clear staging tables so a reused test DB (--reuse-db) is empty.
+
+        Runs inside each test's transaction, so the deletes roll back too.
+        The cached availability flag is reset around each test as well.
+        """
+        from infrastructure.database.models import (
+            StgCoche,
+            StgFormacionModulo,
+            StgKilometraje,
+            StgModulo,
+            StgOtSimaf,
+        )
+
+        from etl.extractors.postgres_extractor import (
+            invalidate_postgres_staging_availability,
+        )
+
+        for model in (StgFormacionModulo, StgCoche, StgOtSimaf, StgKilometraje, StgModulo):
+            model.objects.all().delete()
+        invalidate_postgres_staging_availability()
+        yield
+        invalidate_postgres_staging_availability()
+
     def test_is_postgres_staging_available_empty(self):
         """Should return False when no staging data exists."""
         from etl.extractors.postgres_extractor import is_postgres_staging_available
         # Fresh test DB should be empty
         assert is_postgres_staging_available() is False
 
+    def test_is_postgres_staging_available_cached(self):
+        """The availability check is cached until invalidated."""
+        from etl.extractors.postgres_extractor import (
+            invalidate_postgres_staging_availability,
+            is_postgres_staging_available,
+        )
+        from infrastructure.database.models import StgModulo
+
+        assert is_postgres_staging_available() is False
+        StgModulo.objects.create(access_id=1, nombre="M01")
+        assert is_postgres_staging_available() is False
+
+        invalidate_postgres_staging_availability()
+        assert is_postgres_staging_available() is True
+
     def test_get_modules_from_postgres_empty(self):
         """Should return empty list when no staging data exists."""
         from etl.extractors.postgres_extractor import get_modules_from_postgres
@@ -224,14 +266,63 @@ class TestPostgresExtractorIntegration:
             commissioning_date=commissioning,
         )
         
+        by_cycle = {k.cycle_type: k for k in key_data}
+
         # DA should have commissioning_date
-        da_entry = next(k for k in key_data if k.cycle_type == "DA")
+        da_entry = by_cycle["DA"]
         assert da_entry.last_date == commissioning
         assert da_entry.km_at_last == 0
         assert da_entry.inherited_from == "Puesta en Servicio"
         
         # Lower cycles should inherit from DA
         for cycle in ["PE", "BA", "AN", "IB", "IQ"]:
-            entry = next(k for k in key_data if k.cycle_type == cycle)
+            entry = by_cycle[cycle]
             assert entry.last_date == commissioning, f"{cycle} should inherit DA date"
             assert entry.inherited_from == "DA", f"{cycle} should show inherited_from=DA"
+
+    def test_key_data_batch_matches_per_module(self):
+        """Batched key_data should equal the per-module detail query."""
+        from etl.extractors.postgres_extractor import (
+            get_key_data_batch_from_postgres,
+            get_module_detail_from_postgres,
+        )
+        from infrastructure.database.models import StgOtSimaf
+        from web.fleet.stub_data import ModuleData
+
+        StgOtSimaf.objects.bulk_create([
+            StgOtSimaf(modulo_access_id=1, tarea="IQ", km=480_000, fecha_fin=date(2025, 3, 1)),
+            StgOtSimaf(modulo_access_id=1, tarea="AN2", km=450_000, fecha_fin=date(2024, 11, 5)),
+            StgOtSimaf(modulo_access_id=2, tarea="RB", km=900_000, fecha_fin=date(2024, 6, 10)),
+        ])
+        modules = [
+            ModuleData(
+                module_id=module_id,
+                module_number=number,
+                fleet_type=fleet_type,
+                configuration="tripla",
+                coach_count=3,
+                km_current_month=0,
+                km_total_accumulated=km_total,
+                last_maintenance_date=None,
+                last_maintenance_type="",
+                km_at_last_maintenance=0,
+                module_db_id=db_id,
+                reference_date=date(2015, 5, 20),
+            )
+            for db_id, module_id, number, fleet_type, km_total in (
+                (1, "M50", 50, "CSR", 500_000),
+                (2, "T05", 5, "Toshiba", 950_000),
+            )
+        ]
+
+        batch = get_key_data_batch_from_postgres(modules)
+
+        for mod in modules:
+            _, expected = get_module_detail_from_postgres(
+                module_db_id=mod.module_db_id,
+                module_id=mod.module_id,
+                fleet_type=mod.fleet_type,
+                km_total=mod.km_total_accumulated,
+                commissioning_date=mod.reference_date,
+            )
+            assert batch[mod.module_db_id] == expected
@@ -9,13 +9,50 @@ Tests cover:
 """
 
 from datetime import date, timedelta
+
+import pytest
+
+from core.domain.reference_data import RG_REFERENCE_DATES
 from web.fleet.stub_data import (
+    CoachInfo,
     ModuleData,
+    _get_month_name_es,
     get_all_modules,
     get_fleet_summary,
 )
 
 
+# Expected values are static, so they are built once at import time
+_EXPECTED_CSR_IDS = tuple(f"M{i:02d}" for i in range(1, 87) if i != 67)
+_TOSHIBA_REF_IDS = tuple(sorted(
+    (mid for mid in RG_REFERENCE_DATES if mid.startswith("T")),
+    key=lambda x: int(x[1:]),
+))
+_VALID_CSR_TYPES = frozenset({"IQ", "IB", "AN", "BA", "RS", "DA"})
+_VALID_TOSHIBA_TYPES = frozenset({"MEN", "RB", "RG"})
+
+
+@pytest.fixture(scope="module")
+def fleet_partition(all_modules):
+    """all_modules bucketed by fleet_type in a single pass."""
+    partition: dict[str, list] = {"CSR": [], "Toshiba": []}
+    for m in all_modules:
+        partition[m.fleet_type].append(m)
+    return {fleet: tuple(modules) for fleet, modules in partition.items()}
+
+
+@pytest.fixture(scope="module")
+def fleet_totals(fleet_partition):
+    """Per-fleet km totals of the stub fleet."""
+    csr, toshiba = fleet_partition["CSR"], fleet_partition["Toshiba"]
+    return {
+        "csr_km_month": sum(m.km_current_month for m in csr),
+        "toshiba_km_month": sum(m.km_current_month for m in toshiba),
+        "csr_km_total": sum(m.km_total_accumulated for m in csr),
+        "toshiba_km_total": sum(m.km_total_accumulated for m in toshiba),
+    }
+
+
 class TestModuleData:
     """Tests for ModuleData dataclass."""
 
@@ -52,6 +89,38 @@ class TestModuleData:
 
         assert module.days_since_maintenance == 10
 
+    def test_coach_composition_str(self):
+        """coach_composition_str joins coaches in order and is cached."""
+        module = ModuleData(
+            module_id="M01",
+            module_number=1,
+            fleet_type="CSR",
+            configuration="tripla",
+            coach_count=3,
+            km_current_month=10000,
+            km_total_accumulated=500000,
+            last_maintenance_date=date(2025, 1, 1),
+            last_maintenance_type="IQ",
+            km_at_last_maintenance=450000,
+            coaches=[CoachInfo(5001, "MC1"), CoachInfo(4001, "R1"), CoachInfo(5501, "MC2")],
+        )
+
+        assert module.coach_composition_str == "MC1 5001 - R1 4001 - MC2 5501"
+        assert module.coach_composition_str is module.coach_composition_str
+
+    def test_dropdown_label(self, sample_module_data):
+        """dropdown_label shows module id and fleet, and is cached."""
+        assert sample_module_data.dropdown_label == "M01 (CSR)"
+        assert sample_module_data.dropdown_label is sample_module_data.dropdown_label
+
+    @pytest.mark.parametrize(
+        ("month", "expected"),
+        [(1, "Enero"), (9, "Septiembre"), (12, "Diciembre"), (0, ""), (13, "")],
+    )
+    def test_month_name_es(self, month, expected):
+        """_get_month_name_es maps 1-12 to Spanish names, else empty."""
+        assert _get_month_name_es(month) == expected
+
 
 class TestCSRModuleGeneration:
     """Tests for CSR module generation rules.
@@ -76,9 +145,8 @@ class TestCSRModuleGeneration:
 
     def test_module_ids_format(self, csr_modules):
         """Module IDs should be M01-M86 format (excluding M67)."""
-        expected_ids = [f"M{i:02d}" for i in range(1, 87) if i != 67]
-        actual_ids = [m.module_id for m in csr_modules]
-        assert actual_ids == expected_ids
+        actual_ids = tuple(m.module_id for m in csr_modules)
+        assert actual_ids == _EXPECTED_CSR_IDS
 
     def test_modules_1_to_42_are_cuadruplas(self, csr_modules):
         """Modules M01-M42 should be cuadruplas with 4 coaches."""
@@ -101,9 +169,8 @@ class TestCSRModuleGeneration:
 
     def test_csr_maintenance_types(self, csr_modules):
         """CSR modules should only have valid CSR maintenance types."""
-        valid_types = {"IQ", "IB", "AN", "BA", "RS", "DA"}
         for module in csr_modules:
-            assert module.last_maintenance_type in valid_types
+            assert module.last_maintenance_type in _VALID_CSR_TYPES
 
     def test_csr_modules_have_coaches(self, csr_modules):
         """Todos los módulos CSR deben tener composición de coches."""
@@ -137,13 +204,7 @@ class TestToshibaModuleGeneration:
 
     def test_module_ids_from_reference_data(self, toshiba_modules):
         """Module IDs deben coincidir con reference_data (no secuenciales)."""
-        from core.domain.reference_data import RG_REFERENCE_DATES
-        expected_ids = sorted(
-            [mid for mid in RG_REFERENCE_DATES.keys() if mid.startswith("T")],
-            key=lambda x: int(x[1:])
-        )
-        actual_ids = [m.module_id for m in toshiba_modules]
-        assert actual_ids == expected_ids
+        assert tuple(m.module_id for m in toshiba_modules) == _TOSHIBA_REF_IDS
 
     def test_12_cuadruplas_and_13_triplas(self, toshiba_modules):
         """Toshiba: 12 cuadruplas y 13 triplas."""
@@ -160,9 +221,8 @@ class TestToshibaModuleGeneration:
 
     def test_toshiba_maintenance_types(self, toshiba_modules):
         """Toshiba modules should only have valid Toshiba maintenance types."""
-        valid_types = {"MEN", "RB", "RG"}
         for module in toshiba_modules:
-            assert module.last_maintenance_type in valid_types
+            assert module.last_maintenance_type in _VALID_TOSHIBA_TYPES
 
     def test_toshiba_modules_have_coaches(self, toshiba_modules):
         """Todos los módulos Toshiba deben tener composición de coches."""
@@ -185,13 +245,10 @@ class TestGetAllModules:
         """Retorna 85 CSR + 25 Toshiba = 110 módulos (M67 excluido)."""
         assert len(all_modules) == 110
 
-    def test_contains_85_csr_and_25_toshiba(self, all_modules):
+    def test_contains_85_csr_and_25_toshiba(self, fleet_partition):
         """Contiene exactamente 85 CSR y 25 Toshiba."""
-        csr = [m for m in all_modules if m.fleet_type == "CSR"]
-        toshiba = [m for m in all_modules if m.fleet_type == "Toshiba"]
-        
-        assert len(csr) == 85
-        assert len(toshiba) == 25
+        assert len(fleet_partition["CSR"]) == 85
+        assert len(fleet_partition["Toshiba"]) == 25
 
     def test_consistent_with_seed(self):
         """Multiple calls should return same data (seeded)."""
@@ -202,6 +259,20 @@ class TestGetAllModules:
         assert modules1[0].km_current_month == modules2[0].km_current_month
         assert modules1[0].km_total_accumulated == modules2[0].km_total_accumulated
 
+    def test_history_most_recent_first(self, all_modules):
+        """Maintenance history is generated in date-descending order."""
+        for module in all_modules:
+            dates = [e.event_date for e in module.maintenance_history]
+            assert dates == sorted(dates, reverse=True)
+
+    def test_memoised_with_fresh_list(self):
+        """Repeated calls share ModuleData instances but not the list itself."""
+        modules1 = get_all_modules()
+        modules2 = get_all_modules()
+
+        assert modules1 is not modules2
+        assert all(a is b for a, b in zip(modules1, modules2))
+
 
 class TestFleetSummary:
     """Tests for fleet summary KPI calculations."""
@@ -214,22 +285,22 @@ class TestFleetSummary:
         assert summary["toshiba_count"] == 25
         assert summary["total_count"] == 110
 
-    def test_summary_km_month_totals(self, all_modules):
+    def test_summary_km_month_totals(self, all_modules, fleet_totals):
         """km_month totals should be sum of individual modules."""
         summary = get_fleet_summary(all_modules)
         
-        csr_km = sum(m.km_current_month for m in all_modules if m.fleet_type == "CSR")
-        toshiba_km = sum(m.km_current_month for m in all_modules if m.fleet_type == "Toshiba")
+        csr_km = fleet_totals["csr_km_month"]
+        toshiba_km = fleet_totals["toshiba_km_month"]
         
         assert summary["csr_km_month"] == csr_km
         assert summary["toshiba_km_month"] == toshiba_km
         assert summary["total_km_month"] == csr_km + toshiba_km
 
-    def test_summary_km_total_accumulated(self, all_modules):
+    def test_summary_km_total_accumulated(self, all_modules, fleet_totals):
         """km_total should be sum of accumulated km."""
         summary = get_fleet_summary(all_modules)
         
-        total_accumulated = sum(m.km_total_accumulated for m in all_modules)
+        total_accumulated = fleet_totals["csr_km_total"] + fleet_totals["toshiba_km_total"]
         assert summary["total_km_total"] == total_accumulated
 
     def test_summary_with_empty_list(self):
@@ -5,15 +5,17 @@ This module provides mock data for the UI development phase.
 Will be replaced by actual database queries in production.
 """
 
+import functools
 import random
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import date, timedelta
-from typing import Literal
+from datetime import date
+from typing import Literal, TypedDict
 
 from core.domain.reference_data import RG_REFERENCE_DATES
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoachInfo:
     """Information about a single coach in an EMU composition."""
 
@@ -24,7 +26,7 @@ class CoachInfo:
         return f"{self.coach_type} {self.number}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintenanceEvent:
     """A single maintenance event from the history."""
 
@@ -37,7 +39,7 @@ class MaintenanceEvent:
     duration_days: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MaintenanceKeyData:
     """Last intervention data for a specific maintenance cycle type.
 
@@ -54,7 +56,7 @@ class MaintenanceKeyData:
     inherited_from: str | None = None  # e.g., "RG" if RB inherited from RG
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleData:
     """Data structure for a fleet module card."""
 
@@ -72,7 +74,7 @@ class ModuleData:
     # Internal Access DB FK (used to fetch detail data on demand)
     module_db_id: int | None = None
     # Coach composition (optional, populated from Access)
-    coaches: list[CoachInfo] = field(default_factory=list)
+    coaches: Sequence[CoachInfo] = ()
     # Reference date for RG/commissioning
     reference_date: date | None = None
     reference_type: str = ""  # "RG" or "Puesta en Servicio"
@@ -80,9 +82,19 @@ class ModuleData:
     last_rg_date: date | None = None
     km_at_last_rg: int | None = None
     # Maintenance history (last year) for detail view
-    maintenance_history: list[MaintenanceEvent] = field(default_factory=list)
+    # Empty-tuple defaults are shared, so modules without detail data (the
+    # list view) allocate nothing; consumers only test and iterate these.
+    maintenance_history: Sequence[MaintenanceEvent] = ()
     # Key data per maintenance cycle type for projection
-    maintenance_key_data: list[MaintenanceKeyData] = field(default_factory=list)
+    maintenance_key_data: Sequence[MaintenanceKeyData] = ()
+    # Memoised coach_composition_str (slots rule out functools.cached_property)
+    _coach_composition: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Memoised dropdown_label, same reason
+    _dropdown_label: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def km_since_maintenance(self) -> int:
@@ -96,10 +108,24 @@ class ModuleData:
 
     @property
     def coach_composition_str(self) -> str:
-        """Return formatted coach composition string."""
-        if not self.coaches:
-            return ""
-        return " - ".join(str(c) for c in self.coaches)
+        """Return formatted coach composition string.
+
+        Cached on first access; ``coaches`` is only set at construction.
+        """
+        if self._coach_composition is None:
+            self._coach_composition = " - ".join(map(str, self.coaches))
+        return self._coach_composition
+
+    @property
+    def dropdown_label(self) -> str:
+        """Return the module selector label, e.g. ``"M01 (CSR)"``.
+
+        Cached on first access, so it is shared by every request that
+        reuses the cached module list.
+        """
+        if self._dropdown_label is None:
+            self._dropdown_label = f"{self.module_id} ({self.fleet_type})"
+        return self._dropdown_label
 
     @property
     def km_current_month_label(self) -> str:
@@ -124,24 +150,26 @@ class ModuleData:
         return self.km_total_accumulated - self.km_at_last_rg
 
 
+_MONTHS_ES: tuple[str, ...] = (
+    "Enero",
+    "Febrero",
+    "Marzo",
+    "Abril",
+    "Mayo",
+    "Junio",
+    "Julio",
+    "Agosto",
+    "Septiembre",
+    "Octubre",
+    "Noviembre",
+    "Diciembre",
+)
+
+
 def _get_month_name_es(month_number: int) -> str:
     """Return Spanish month name for a given month number (1-12)."""
-    months = [
-        "Enero",
-        "Febrero",
-        "Marzo",
-        "Abril",
-        "Mayo",
-        "Junio",
-        "Julio",
-        "Agosto",
-        "Septiembre",
-        "Octubre",
-        "Noviembre",
-        "Diciembre",
-    ]
     if 1 <= month_number <= 12:
-        return months[month_number - 1]
+        return _MONTHS_ES[month_number - 1]
     return ""
 
 
@@ -166,27 +194,27 @@ TOSHIBA_COACH_BASES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def _generate_coach_composition(
     module_number: int,
     fleet_type: Literal["CSR", "Toshiba"],
     configuration: Literal["tripla", "cuadrupla"],
-) -> list[CoachInfo]:
+) -> tuple[CoachInfo, ...]:
     """Generate realistic coach composition for a module.
 
-    Coach numbers are derived from the module number to maintain consistency.
+    Coach numbers are derived from the module number to maintain consistency,
+    so the (immutable) result is cached and shared across fleet rebuilds.
     """
     if fleet_type == "CSR":
         bases = CSR_COACH_BASES[configuration]
     else:
         bases = TOSHIBA_COACH_BASES[configuration]
 
-    coaches = []
-    for coach_type, base_number in bases:
-        # Generate coach number based on module number for consistency
-        coach_number = base_number + module_number
-        coaches.append(CoachInfo(number=coach_number, coach_type=coach_type))
-
-    return coaches
+    # Generate coach number based on module number for consistency
+    return tuple(
+        CoachInfo(number=base_number + module_number, coach_type=coach_type)
+        for coach_type, base_number in bases
+    )
 
 
 # =============================================================================
@@ -205,64 +233,107 @@ TOSHIBA_CYCLES = [
     ("RG", "Reparación General (RG)", 600_000),
 ]
 
+
+def _with_draw_bounds(
+    cycles: list[tuple[str, str, int]],
+) -> tuple[tuple[str, str, int, int, int], ...]:
+    """Append the simulated km-since bounds (10%-85% of the cycle) to each cycle."""
+    return tuple(
+        (cycle_type, label, cycle_km, int(cycle_km * 0.1), int(cycle_km * 0.85))
+        for cycle_type, label, cycle_km in cycles
+    )
+
+
+# Cycle definitions with precomputed draw bounds for the key-data generators
+_CSR_CYCLE_DRAWS = _with_draw_bounds(CSR_CYCLES)
+_TOSHIBA_CYCLE_DRAWS = _with_draw_bounds(TOSHIBA_CYCLES)
+
+# Actual Toshiba module IDs from reference data (T04, T06, T09, ...),
+# sorted by module number once at import
+TOSHIBA_MODULE_IDS: tuple[str, ...] = tuple(sorted(
+    (mid for mid in RG_REFERENCE_DATES if mid.startswith("T")),
+    key=lambda x: int(x[1:]),
+))
+# Cuadruplas: first 12 modules, Triplas: remaining 13
+TOSHIBA_CUADRUPLA_IDS: frozenset[str] = frozenset(TOSHIBA_MODULE_IDS[:12])
+
 # CSR maintenance task variants (Access stores AN1-AN6, BA1-BA3, etc.)
-CSR_HISTORY_TASKS = ["IQ", "IQ", "IQ", "IB", "IB", "AN1", "AN2", "AN3", "BA1"]
-TOSHIBA_HISTORY_TASKS = ["MEN", "MEN", "MEN", "MEN", "RB"]
+CSR_HISTORY_TASKS = ("IQ", "IQ", "IQ", "IB", "IB", "AN1", "AN2", "AN3", "BA1")
+TOSHIBA_HISTORY_TASKS = ("MEN", "MEN", "MEN", "MEN", "RB")
+
+# Seed for the stub random generators, so every build yields the same fleet
+STUB_SEED = 42
+
+# Value pools for the batched history draws
+_HISTORY_DAYS_AGO = range(1, 366)
+_HISTORY_DURATIONS = (1, 2, 3)
+_HISTORY_OT_NUMBERS = range(1000, 10000)
+
+# Last-maintenance types drawn for the module cards
+CSR_MAINTENANCE_TYPES = ("IQ", "IB", "AN", "BA", "RS", "DA")
+TOSHIBA_MAINTENANCE_TYPES = ("MEN", "RB", "RG")
 
 
 def _generate_maintenance_history(
     fleet_type: str,
     km_total: int,
     base_date: date,
+    rng: random.Random,
 ) -> list[MaintenanceEvent]:
     """Generate realistic maintenance history for the last 365 days."""
     history: list[MaintenanceEvent] = []
     tasks = CSR_HISTORY_TASKS if fleet_type == "CSR" else TOSHIBA_HISTORY_TASKS
     avg_daily_km = 392 if fleet_type == "CSR" else 260
-
-    # Generate between 5-15 events spread over the last year
-    num_events = random.randint(5, 15)
-    for _ in range(num_events):
-        days_ago = random.randint(1, 365)
-        event_date = base_date - timedelta(days=days_ago)
-        km_at_event = max(0, km_total - int(days_ago * avg_daily_km))
-        task = random.choice(tasks)
-        duration_days = random.randint(1, 3)
-        start_date = event_date - timedelta(days=duration_days)
-        ot_simaf = f"OT-{random.randint(1000, 9999)}"
+    # Date arithmetic is done on ordinals to skip the timedelta round-trip
+    base_ord = base_date.toordinal()
+
+    # Generate between 5-15 events spread over the last year, drawing each
+    # attribute for all events in one batched call. Sorting the offsets
+    # ascending yields events already in date-descending order (most
+    # recent first), with no keyed sort.
+    num_events = rng.randint(5, 15)
+    days_ago_list = sorted(rng.choices(_HISTORY_DAYS_AGO, k=num_events))
+    task_list = rng.choices(tasks, k=num_events)
+    duration_list = rng.choices(_HISTORY_DURATIONS, k=num_events)
+    ot_list = rng.choices(_HISTORY_OT_NUMBERS, k=num_events)
+
+    for days_ago, task, duration_days, ot in zip(
+        days_ago_list, task_list, duration_list, ot_list
+    ):
+        event_ord = base_ord - days_ago
+        event_date = date.fromordinal(event_ord)
         history.append(MaintenanceEvent(
             event_date=event_date,
-            start_date=start_date,
+            start_date=date.fromordinal(event_ord - duration_days),
             end_date=event_date,
             task_type=task,
-            km_at_event=km_at_event,
-            ot_simaf=ot_simaf,
+            km_at_event=max(0, km_total - days_ago * avg_daily_km),
+            ot_simaf=f"OT-{ot}",
             duration_days=duration_days,
         ))
 
-    # Sort by date descending (most recent first)
-    history.sort(key=lambda e: e.event_date, reverse=True)
     return history
 
 
 def _generate_key_data_csr(
     km_total: int,
     reference_date: date | None,
+    today: date,
+    rng: random.Random,
 ) -> list[MaintenanceKeyData]:
     """Generate key maintenance data for CSR modules."""
     key_data: list[MaintenanceKeyData] = []
-    today = date.today()
+    today_ord = today.toordinal()
 
-    for cycle_type, label, cycle_km in CSR_CYCLES:
+    for cycle_type, label, cycle_km, km_lo, km_hi in _CSR_CYCLE_DRAWS:
         # Simulate that last intervention happened some fraction of cycle ago
-        km_since = random.randint(int(cycle_km * 0.1), int(cycle_km * 0.85))
-        km_at_last = km_total - km_since
-        if km_at_last < 0:
-            km_at_last = 0
-            km_since = km_total
+        km_since = rng.randint(km_lo, km_hi)
+        # Clamp at zero; km_since then shrinks to km_total when it fires
+        km_at_last = max(0, km_total - km_since)
+        km_since = km_total - km_at_last
         # Estimate date based on ~392 km/day average
         days_ago = km_since // 392
-        last_date = today - timedelta(days=days_ago)
+        last_date = date.fromordinal(today_ord - days_ago)
 
         key_data.append(MaintenanceKeyData(
             cycle_type=cycle_type,
@@ -288,12 +359,14 @@ def _generate_key_data_toshiba(
     km_total: int,
     last_rg_date: date | None,
     km_at_last_rg: int | None,
+    today: date,
+    rng: random.Random,
 ) -> list[MaintenanceKeyData]:
     """Generate key maintenance data for Toshiba modules."""
     key_data: list[MaintenanceKeyData] = []
-    today = date.today()
+    today_ord = today.toordinal()
 
-    for cycle_type, label, cycle_km in TOSHIBA_CYCLES:
+    for cycle_type, label, cycle_km, km_lo, km_hi in _TOSHIBA_CYCLE_DRAWS:
         if cycle_type == "RG" and last_rg_date is not None and km_at_last_rg is not None:
             # Use real RG data that was already generated
             km_since = km_total - km_at_last_rg
@@ -307,13 +380,12 @@ def _generate_key_data_toshiba(
             ))
         else:
             # RB: simulate
-            km_since = random.randint(int(cycle_km * 0.1), int(cycle_km * 0.85))
-            km_at_last = km_total - km_since
-            if km_at_last < 0:
-                km_at_last = 0
-                km_since = km_total
+            km_since = rng.randint(km_lo, km_hi)
+            # Clamp at zero; km_since then shrinks to km_total when it fires
+            km_at_last = max(0, km_total - km_since)
+            km_since = km_total - km_at_last
             days_ago = km_since // 260
-            last_date = today - timedelta(days=days_ago)
+            last_date = date.fromordinal(today_ord - days_ago)
 
             key_data.append(MaintenanceKeyData(
                 cycle_type=cycle_type,
@@ -327,7 +399,10 @@ def _generate_key_data_toshiba(
     return key_data
 
 
-def generate_csr_modules() -> list[ModuleData]:
+def generate_csr_modules(
+    today: date | None = None,
+    rng: random.Random | None = None,
+) -> list[ModuleData]:
     """
     Generate stub data for 86 CSR modules.
 
@@ -335,9 +410,22 @@ def generate_csr_modules() -> list[ModuleData]:
     - M01-M42: cuadruplas (4 coaches)
     - M43-M86: triplas (3 coaches)
     - M67 excluded: never commissioned, used as parts donor
+
+    Args:
+        today: Date all generated dates are relative to.
+            Defaults to ``date.today()``.
+        rng: Random source for the mock values. Defaults to a fresh
+            ``random.Random(STUB_SEED)``, so output is reproducible.
     """
+    today = today or date.today()
+    if rng is None:
+        rng = random.Random(STUB_SEED)
+    today_ord = today.toordinal()
     modules = []
-    maintenance_types = ["IQ", "IB", "AN", "BA", "RS", "DA"]
+    # Fields shared by every CSR module are bound once
+    make_module = functools.partial(
+        ModuleData, fleet_type="CSR", km_current_month_date=today
+    )
 
     for i in range(1, 87):
         module_number = i
@@ -356,11 +444,11 @@ def generate_csr_modules() -> list[ModuleData]:
             coach_count = 3
 
         # Generate realistic mock data
-        km_total = random.randint(150_000, 1_200_000)
-        km_month = random.randint(3_000, 15_000)
-        days_ago = random.randint(5, 180)
-        last_maint_date = date.today() - timedelta(days=days_ago)
-        km_at_maint = km_total - random.randint(5_000, 50_000)
+        km_total = rng.randint(150_000, 1_200_000)
+        km_month = rng.randint(3_000, 15_000)
+        days_ago = rng.randint(5, 180)
+        last_maint_date = date.fromordinal(today_ord - days_ago)
+        km_at_maint = km_total - rng.randint(5_000, 50_000)
 
         # Get reference date from domain data
         ref_data = RG_REFERENCE_DATES.get(module_id)
@@ -371,22 +459,20 @@ def generate_csr_modules() -> list[ModuleData]:
         coaches = _generate_coach_composition(module_number, "CSR", configuration)
 
         # Generate detail data
-        history = _generate_maintenance_history("CSR", km_total, date.today())
-        key_data = _generate_key_data_csr(km_total, reference_date)
+        history = _generate_maintenance_history("CSR", km_total, today, rng)
+        key_data = _generate_key_data_csr(km_total, reference_date, today, rng)
 
         modules.append(
-            ModuleData(
+            make_module(
                 module_id=module_id,
                 module_number=module_number,
-                fleet_type="CSR",
                 configuration=configuration,
                 coach_count=coach_count,
                 km_current_month=km_month,
                 km_total_accumulated=km_total,
                 last_maintenance_date=last_maint_date,
-                last_maintenance_type=random.choice(maintenance_types),
+                last_maintenance_type=rng.choice(CSR_MAINTENANCE_TYPES),
                 km_at_last_maintenance=km_at_maint,
-                km_current_month_date=date.today(),
                 coaches=coaches,
                 reference_date=reference_date,
                 reference_type=reference_type,
@@ -398,7 +484,10 @@ def generate_csr_modules() -> list[ModuleData]:
     return modules
 
 
-def generate_toshiba_modules() -> list[ModuleData]:
+def generate_toshiba_modules(
+    today: date | None = None,
+    rng: random.Random | None = None,
+) -> list[ModuleData]:
     """
     Generate stub data for 25 Toshiba modules.
 
@@ -409,23 +498,27 @@ def generate_toshiba_modules() -> list[ModuleData]:
     - Cuadruplas: T04-T22 (even numbered, some gaps)
     - Triplas: T28-T52 (higher numbers)
     - RG cycle is every 600,000 km
+
+    Args:
+        today: Date all generated dates are relative to.
+            Defaults to ``date.today()``.
+        rng: Random source for the mock values. Defaults to a fresh
+            ``random.Random(STUB_SEED)``, so output is reproducible.
     """
+    today = today or date.today()
+    if rng is None:
+        rng = random.Random(STUB_SEED)
+    today_ord = today.toordinal()
     modules = []
-    maintenance_types = ["MEN", "RB", "RG"]
-
-    # Get actual Toshiba module IDs from reference data
-    toshiba_ids = sorted(
-        [mid for mid in RG_REFERENCE_DATES.keys() if mid.startswith("T")],
-        key=lambda x: int(x[1:])
+    # Fields shared by every Toshiba module are bound once
+    make_module = functools.partial(
+        ModuleData, fleet_type="Toshiba", km_current_month_date=today
     )
 
-    # Cuadruplas: first 12 modules, Triplas: remaining 13
-    cuadrupla_ids = toshiba_ids[:12]
-
-    for module_id in toshiba_ids:
+    for module_id in TOSHIBA_MODULE_IDS:
         module_number = int(module_id[1:])
 
-        if module_id in cuadrupla_ids:
+        if module_id in TOSHIBA_CUADRUPLA_IDS:
             configuration = "cuadrupla"
             coach_count = 4
         else:
@@ -433,11 +526,11 @@ def generate_toshiba_modules() -> list[ModuleData]:
             coach_count = 3
 
         # Generate realistic mock data
-        km_total = random.randint(200_000, 800_000)
-        km_month = random.randint(4_000, 18_000)
-        days_ago = random.randint(5, 120)
-        last_maint_date = date.today() - timedelta(days=days_ago)
-        km_at_maint = km_total - random.randint(8_000, 60_000)
+        km_total = rng.randint(200_000, 800_000)
+        km_month = rng.randint(4_000, 18_000)
+        days_ago = rng.randint(5, 120)
+        last_maint_date = date.fromordinal(today_ord - days_ago)
+        km_at_maint = km_total - rng.randint(8_000, 60_000)
 
         # Get real RG date from reference data
         ref_data = RG_REFERENCE_DATES.get(module_id)
@@ -446,33 +539,33 @@ def generate_toshiba_modules() -> list[ModuleData]:
 
         # Calculate km at last RG based on date (estimate ~260 km/day average for Toshiba)
         if last_rg_date:
-            days_since_rg = (date.today() - last_rg_date).days
+            days_since_rg = today_ord - last_rg_date.toordinal()
             km_since_last_rg = min(int(days_since_rg * 260), km_total)
             km_at_last_rg = max(0, km_total - km_since_last_rg)
         else:
-            km_since_last_rg = random.randint(50_000, 550_000)
+            km_since_last_rg = rng.randint(50_000, 550_000)
             km_at_last_rg = max(0, km_total - km_since_last_rg)
 
         # Generate coach composition
         coaches = _generate_coach_composition(module_number, "Toshiba", configuration)
 
         # Generate detail data
-        history = _generate_maintenance_history("Toshiba", km_total, date.today())
-        key_data = _generate_key_data_toshiba(km_total, last_rg_date, km_at_last_rg)
+        history = _generate_maintenance_history("Toshiba", km_total, today, rng)
+        key_data = _generate_key_data_toshiba(
+            km_total, last_rg_date, km_at_last_rg, today, rng
+        )
 
         modules.append(
-            ModuleData(
+            make_module(
                 module_id=module_id,
                 module_number=module_number,
-                fleet_type="Toshiba",
                 configuration=configuration,
                 coach_count=coach_count,
                 km_current_month=km_month,
                 km_total_accumulated=km_total,
                 last_maintenance_date=last_maint_date,
-                last_maintenance_type=random.choice(maintenance_types),
+                last_maintenance_type=rng.choice(TOSHIBA_MAINTENANCE_TYPES),
                 km_at_last_maintenance=km_at_maint,
-                km_current_month_date=date.today(),
                 coaches=coaches,
                 reference_date=last_rg_date,
                 reference_type=reference_type,
@@ -486,45 +579,93 @@ def generate_toshiba_modules() -> list[ModuleData]:
     return modules
 
 
+@functools.lru_cache(maxsize=1)
+def _build_all_modules(today: date) -> tuple[ModuleData, ...]:
+    """Generate the seeded stub fleet; cached per calendar day.
+
+    All generated dates are relative to *today*, so it is part of the
+    cache key and the fleet is rebuilt when the day changes.
+    """
+    # One private generator for both fleets: consistent data across page
+    # loads, without touching the global random state
+    rng = random.Random(STUB_SEED)
+    return tuple(
+        generate_csr_modules(today, rng) + generate_toshiba_modules(today, rng)
+    )
+
+
 def get_all_modules() -> list[ModuleData]:
-    """Get all modules (CSR + Toshiba) with consistent random seed."""
-    random.seed(42)  # Consistent data across page loads
-    csr = generate_csr_modules()
-    toshiba = generate_toshiba_modules()
-    return csr + toshiba
+    """Get all modules (CSR + Toshiba) with consistent random seed.
+
+    The fleet is generated once per day and memoised; each call returns a
+    new list over the same ``ModuleData`` instances, which callers must
+    treat as read-only. The memoisation is only valid because the data is
+    seeded; drop it (or bound it with a TTL) if this ever reads live data.
+
+    Every element is built directly as a ``ModuleData`` instance (never a
+    subclass), so callers may rely on ``type(m) is ModuleData``.
+    """
+    return list(_build_all_modules(date.today()))
+
+
+class FleetSummary(TypedDict):
+    """Fleet KPIs shown in the module list header."""
 
+    csr_count: int
+    toshiba_count: int
+    total_count: int
+    csr_km_month: int
+    toshiba_km_month: int
+    total_km_month: int
+    csr_km_total: int
+    toshiba_km_total: int
+    total_km_total: int
+    km_month_label: str
+    avg_km_day: int
 
-def get_fleet_summary(modules: list[ModuleData]) -> dict:
+
+def get_fleet_summary(modules: list[ModuleData]) -> FleetSummary:
     """
     Calculate fleet summary KPIs.
 
     Returns:
-        Dict with km totals for CSR, Toshiba, and combined.
+        FleetSummary with km totals for CSR, Toshiba, and combined.
     """
-    csr_modules = [m for m in modules if m.fleet_type == "CSR"]
-    toshiba_modules = [m for m in modules if m.fleet_type == "Toshiba"]
-
+    # Single pass over the fleet; totals are accumulated per fleet type
+    csr_count = toshiba_count = 0
+    csr_km_month = toshiba_km_month = 0
+    csr_km_total = toshiba_km_total = 0
+    total_km_month = total_km_total = 0
     month_label = ""
     for module in modules:
-        if module.km_current_month_label:
-            month_label = module.km_current_month_label
-            break
+        km_month = module.km_current_month
+        km_total = module.km_total_accumulated
+        total_km_month += km_month
+        total_km_total += km_total
+        if module.fleet_type == "CSR":
+            csr_count += 1
+            csr_km_month += km_month
+            csr_km_total += km_total
+        elif module.fleet_type == "Toshiba":
+            toshiba_count += 1
+            toshiba_km_month += km_month
+            toshiba_km_total += km_total
+        if not month_label and module.km_current_month_date is not None:
+            month_label = _MONTHS_ES[module.km_current_month_date.month - 1]
 
-    total_km_month = sum(m.km_current_month for m in modules)
-    
     # Calculate average km per day (assuming 30-day month)
     avg_km_day = total_km_month // 30 if total_km_month > 0 else 0
 
     return {
-        "csr_count": len(csr_modules),
-        "toshiba_count": len(toshiba_modules),
+        "csr_count": csr_count,
+        "toshiba_count": toshiba_count,
         "total_count": len(modules),
-        "csr_km_month": sum(m.km_current_month for m in csr_modules),
-        "toshiba_km_month": sum(m.km_current_month for m in toshiba_modules),
+        "csr_km_month": csr_km_month,
+        "toshiba_km_month": toshiba_km_month,
         "total_km_month": total_km_month,
-        "csr_km_total": sum(m.km_total_accumulated for m in csr_modules),
-        "toshiba_km_total": sum(m.km_total_accumulated for m in toshiba_modules),
-        "total_km_total": sum(m.km_total_accumulated for m in modules),
+        "csr_km_total": csr_km_total,
+        "toshiba_km_total": toshiba_km_total,
+        "total_km_total": total_km_total,
         "km_month_label": month_label,
         "avg_km_day": avg_km_day,
     }
@@ -4,10 +4,24 @@ Custom template filters for fleet module display.
 Provides European number formatting (dot as thousands separator).
 """
 
+import functools
+
 from django import template
 
 register = template.Library()
 
+# Maps the thousands separator produced by format(..., ",d") to a dot
+_DOT_TABLE = str.maketrans(",", ".")
+
+
+@functools.lru_cache(maxsize=512)
+def _euro_int(num: int) -> str:
+    """Format an int with dots as thousands separators (memoised).
+
+    Grids repeat the same figures (cycle thresholds, totals) across cells.
+    """
+    return format(num, ",d").translate(_DOT_TABLE)
+
 
 @register.filter
 def euro_number(value):
@@ -30,9 +44,7 @@ def euro_number(value):
     
     try:
         # Convert to int to remove decimals
-        num = int(value)
-        # Format with dots as thousands separator
-        return f"{num:,}".replace(",", ".")
+        return _euro_int(int(value))
     except (ValueError, TypeError):
         return str(value)
 
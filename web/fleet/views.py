@@ -6,16 +6,26 @@ detailed module information with maintenance projections,
 and sync controls for the Access-to-Postgres ETL.
 """
 
+import hashlib
+import json
 import logging
 import subprocess
 import sys
+import time
+from dataclasses import replace
+from datetime import date
+from typing import Any
 
 from django.contrib.auth.decorators import login_required
 from django.http import Http404, HttpResponse, JsonResponse
 from django.shortcuts import render
-from django.views.decorators.http import require_GET, require_POST
-
-import json
+from django.template.response import TemplateResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET, require_POST
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
 
 from core.services.grid_projection import (
     DEFAULT_AVG_MONTHLY_KM,
@@ -30,18 +40,32 @@ from core.services.maintenance_projection import (
     TOSHIBA_HIERARCHY,
 )
 from etl.extractors.access_extractor import (
+    MODULES_CACHE_TTL_SECONDS,
     get_module_detail_from_access,
     get_modules_with_fallback,
+    get_sync_data_version,
 )
 from etl.extractors.postgres_extractor import (
+    get_key_data_batch_from_postgres,
     get_module_detail_from_postgres,
     is_postgres_staging_available,
 )
+from infrastructure.database.models import SyncLog
 
-from .stub_data import get_fleet_summary
+from .stub_data import MaintenanceKeyData, ModuleData, get_fleet_summary
 
 logger = logging.getLogger(__name__)
 
+# SyncLog columns read by the sync bar; skips the potentially large log_output.
+_SYNC_LOG_STATUS_FIELDS = (
+    "started_at", "finished_at", "status", "tables_synced", "error_message",
+)
+
+# The sync bar polls sync_status about once a second; bursts of polls from
+# several open tabs share one query inside this window.
+SYNC_STATUS_CACHE_TTL_SECONDS = 1.0
+_SYNC_STATUS_CACHE: dict[str, Any] = {"t": 0.0, "v": None}
+
 
 @login_required
 @require_GET
@@ -67,8 +91,7 @@ def module_list(request):
         modules = [m for m in modules if m.fleet_type == "Toshiba"]
 
     # Sync status for the sync bar
-    from infrastructure.database.models import SyncLog
-    latest_sync = SyncLog.objects.first()  # ordered by -started_at
+    latest_sync = _latest_sync_log()
 
     context = {
         "modules": modules,
@@ -77,7 +100,8 @@ def module_list(request):
         "latest_sync": latest_sync,
     }
 
-    return render(request, "fleet/module_list.html", context)
+    # TemplateResponse defers rendering, so callers can inspect context_data
+    return TemplateResponse(request, "fleet/module_list.html", context)
 
 
 @login_required
@@ -103,18 +127,26 @@ def module_detail(request, module_id: str):
     # Get all modules (same data source as list view)
     all_modules = get_modules_with_fallback()
 
-    # Build module lookup and list for dropdown
-    module_lookup = {m.module_id: m for m in all_modules}
+    # Build module lookup and list for dropdown in a single pass
+    module_lookup: dict[str, ModuleData] = {}
+    module_options: list[dict] = []
+    for m in all_modules:
+        module_lookup[m.module_id] = m
+        module_options.append({"id": m.module_id, "label": m.dropdown_label})
     module = module_lookup.get(module_id)
 
     if module is None:
         raise Http404(f"Módulo {module_id} no encontrado")
 
+    # Checked once per request: used for both the detail load and the badge
+    staging_ok = module.module_db_id is not None and is_postgres_staging_available()
+
     # Load detail data on demand if not already populated
-    # (Access-sourced modules have module_db_id but empty history/key_data)
-    if not module.maintenance_key_data and module.module_db_id is not None:
+    # (Postgres/Access modules have module_db_id but no history/key_data).
+    # Gated on the history: it is only ever loaded here, together with key_data.
+    if module.module_db_id is not None and not module.maintenance_history:
         # Prefer Postgres staging; fall back to live ODBC
-        if is_postgres_staging_available():
+        if staging_ok:
             logger.info(
                 "Loading detail data from Postgres for %s (db_id=%s)",
                 module_id, module.module_db_id,
@@ -137,8 +169,13 @@ def module_detail(request, module_id: str):
                 fleet_type=module.fleet_type,
                 km_total=module.km_total_accumulated,
             )
-        module.maintenance_history = history
-        module.maintenance_key_data = key_data
+        # The module list is cached and shared between requests, so the
+        # detail goes on a per-request copy instead of the cached object.
+        module = replace(
+            module,
+            maintenance_history=history,
+            maintenance_key_data=key_data,
+        )
 
     # Prepare key data as dicts for the projection service
     key_data_dicts = [
@@ -158,15 +195,9 @@ def module_detail(request, module_id: str):
         key_data=key_data_dicts,
     )
 
-    # Module list for the dropdown selector
-    module_options = [
-        {"id": m.module_id, "label": f"{m.module_id} ({m.fleet_type})"}
-        for m in all_modules
-    ]
-
     # Determine data source for display
     if module.module_db_id is not None:
-        data_source = "POSTGRES" if is_postgres_staging_available() else "ACCESS"
+        data_source = "POSTGRES" if staging_ok else "ACCESS"
     else:
         data_source = "STUB"
 
@@ -178,26 +209,34 @@ def module_detail(request, module_id: str):
         "data_source": data_source,
     }
 
-    return render(request, "fleet/module_detail.html", context)
+    return TemplateResponse(request, "fleet/module_detail.html", context)
 
 
 # ---------------------------------------------------------------------------
 # Sync Access → Postgres
 # ---------------------------------------------------------------------------
 
-@login_required
-@require_GET
-def sync_status(request):
-    """
-    Return JSON with the latest sync status for Alpine.js polling.
+def _latest_sync_log() -> SyncLog | None:
+    """Most recent SyncLog row, loading only the columns the UI shows."""
+    return SyncLog.objects.only(*_SYNC_LOG_STATUS_FIELDS).first()  # ordered by -started_at
 
-    URL: /fleet/sync/status/
-    """
-    from infrastructure.database.models import SyncLog
 
-    latest = SyncLog.objects.first()  # ordered by -started_at
+def invalidate_sync_status_cache() -> None:
+    """Discard the cached sync_status payload."""
+    _SYNC_STATUS_CACHE["t"] = 0.0
+    _SYNC_STATUS_CACHE["v"] = None
+
+
+def _sync_status_payload() -> dict:
+    """Build the sync_status JSON payload, cached for SYNC_STATUS_CACHE_TTL_SECONDS."""
+    now = time.monotonic()
+    cached = _SYNC_STATUS_CACHE["v"]
+    if cached is not None and now - _SYNC_STATUS_CACHE["t"] < SYNC_STATUS_CACHE_TTL_SECONDS:
+        return cached
+
+    latest = _latest_sync_log()
     if latest is None:
-        return JsonResponse({
+        payload = {
             "has_synced": False,
             "status": "never",
             "started_at": None,
@@ -205,17 +244,32 @@ def sync_status(request):
             "duration": None,
             "tables": {},
             "error": "",
-        })
+        }
+    else:
+        payload = {
+            "has_synced": True,
+            "status": latest.status,
+            "started_at": latest.started_at.isoformat() if latest.started_at else None,
+            "finished_at": latest.finished_at.isoformat() if latest.finished_at else None,
+            "duration": latest.duration_seconds,
+            "tables": latest.tables_synced or {},
+            "error": latest.error_message or "",
+        }
 
-    return JsonResponse({
-        "has_synced": True,
-        "status": latest.status,
-        "started_at": latest.started_at.isoformat() if latest.started_at else None,
-        "finished_at": latest.finished_at.isoformat() if latest.finished_at else None,
-        "duration": latest.duration_seconds,
-        "tables": latest.tables_synced or {},
-        "error": latest.error_message or "",
-    })
+    _SYNC_STATUS_CACHE["t"] = now
+    _SYNC_STATUS_CACHE["v"] = payload
+    return payload
+
+
+@login_required
+@require_GET
+def sync_status(request):
+    """
+    Return JSON with the latest sync status for Alpine.js polling.
+
+    URL: /fleet/sync/status/
+    """
+    return JsonResponse(_sync_status_payload())
 
 
 @login_required
@@ -229,8 +283,6 @@ def sync_trigger(request):
 
     URL: POST /fleet/sync/trigger/
     """
-    from infrastructure.database.models import SyncLog
-
     # Prevent concurrent syncs
     running = SyncLog.objects.filter(status="running").exists()
     if running:
@@ -264,6 +316,9 @@ def sync_trigger(request):
             status=500,
         )
 
+    # Drop the cached status so polls re-query soon. The subprocess creates its
+    # own "running" row, so the first poll may still show the previous sync.
+    invalidate_sync_status_cache()
     return JsonResponse({"ok": True})
 
 
@@ -271,6 +326,186 @@ def sync_trigger(request):
 # Maintenance Planner (projection grid)
 # ---------------------------------------------------------------------------
 
+# Excel export colours per cycle as (fill, font): Tailwind class -> openpyxl
+# hex (no leading #). Built once at import; openpyxl copies each style into
+# the workbook that uses it.
+_EXPORT_CYCLE_STYLES: dict[str, tuple[PatternFill, Font]] = {
+    "AN": (
+        PatternFill("solid", fgColor="DCFCE7"),  # green-100
+        Font(color="166534", bold=True),  # green-800
+    ),
+    "BA": (
+        PatternFill("solid", fgColor="FEF9C3"),  # yellow-100
+        Font(color="854D0E", bold=True),  # yellow-800
+    ),
+    "PE": (
+        PatternFill("solid", fgColor="E0F2FE"),  # sky-100
+        Font(color="075985", bold=True),  # sky-800
+    ),
+    "DA": (
+        PatternFill("solid", fgColor="FEE2E2"),  # red-100
+        Font(color="991B1B", bold=True),  # red-800
+    ),
+    "RB": (
+        PatternFill("solid", fgColor="FEF9C3"),  # yellow-100
+        Font(color="854D0E", bold=True),  # yellow-800
+    ),
+    "RG": (
+        PatternFill("solid", fgColor="FEE2E2"),  # red-100
+        Font(color="991B1B", bold=True),  # red-800
+    ),
+}
+# Prebuilt cell styles for the export, as the attributes each cell gets.
+_EXPORT_BOLD = Font(bold=True)
+_EXPORT_GRAY_FILL = PatternFill("solid", fgColor="F3F4F6")  # gray-100
+_EXPORT_CENTER = Alignment(horizontal="center")
+_EXPORT_RIGHT = Alignment(horizontal="right")
+_EXPORT_KM_FORMAT = "#,##0"
+
+_EXPORT_STYLES: dict[str, dict[str, Any]] = {
+    "header": {
+        "font": Font(bold=True, size=10),
+        "fill": _EXPORT_GRAY_FILL,
+        "alignment": _EXPORT_CENTER,
+    },
+    "module": {"font": _EXPORT_BOLD},
+    "module_merged": {
+        "font": _EXPORT_BOLD,
+        "alignment": Alignment(horizontal="center", vertical="center"),
+    },
+    "date": {"alignment": _EXPORT_CENTER, "number_format": "DD/MM/YYYY"},
+    "center": {"alignment": _EXPORT_CENTER},
+    "km": {"alignment": _EXPORT_RIGHT, "number_format": _EXPORT_KM_FORMAT},
+    "label": {"font": _EXPORT_BOLD, "alignment": _EXPORT_CENTER},
+    "control": {
+        "font": _EXPORT_BOLD,
+        "fill": _EXPORT_GRAY_FILL,
+        "alignment": _EXPORT_CENTER,
+    },
+}
+
+# Per-cycle styles keyed by (cycle_type, role):
+#   exceeded: km cell past its threshold     mark: intervention cell
+#   label: summary row label                 count: non-zero summary count
+# Cycles without colours fall back to _EXPORT_CYCLE_FALLBACK[role].
+_EXPORT_CYCLE_CELL_STYLES: dict[tuple[str, str], dict[str, Any]] = {}
+for _cycle, (_fill, _font) in _EXPORT_CYCLE_STYLES.items():
+    _EXPORT_CYCLE_CELL_STYLES[_cycle, "exceeded"] = {
+        **_EXPORT_STYLES["km"], "font": _font, "fill": _fill,
+    }
+    _EXPORT_CYCLE_CELL_STYLES[_cycle, "mark"] = {
+        "font": _font, "fill": _fill, "alignment": _EXPORT_CENTER,
+    }
+    _EXPORT_CYCLE_CELL_STYLES[_cycle, "label"] = {
+        **_EXPORT_STYLES["label"], "fill": _fill,
+    }
+    _EXPORT_CYCLE_CELL_STYLES[_cycle, "count"] = {
+        "fill": _fill, "alignment": _EXPORT_CENTER,
+    }
+del _cycle, _fill, _font
+
+_EXPORT_CYCLE_FALLBACK: dict[str, dict[str, Any]] = {
+    "exceeded": _EXPORT_STYLES["km"],
+    "mark": _EXPORT_STYLES["center"],
+    "label": _EXPORT_STYLES["label"],
+    "count": _EXPORT_STYLES["center"],
+}
+
+
+def _cycle_style(cycle_type: str, role: str) -> dict[str, Any]:
+    """Return the export style for *role* cells of *cycle_type*."""
+    return _EXPORT_CYCLE_CELL_STYLES.get(
+        (cycle_type, role), _EXPORT_CYCLE_FALLBACK[role]
+    )
+
+
+def _styled_cell(ws, value, style: dict[str, Any] | None = None) -> WriteOnlyCell:
+    """
+    Build a write-only cell for *ws* holding *value*, with the font, fill,
+    alignment and number_format given in *style* (an ``_EXPORT_STYLES``
+    entry or ``_cycle_style()`` result).
+    """
+    cell = WriteOnlyCell(ws, value=value)
+    for attr, style_value in (style or {}).items():
+        setattr(cell, attr, style_value)
+    return cell
+
+
+def _load_missing_key_data(
+    modules: list[ModuleData],
+) -> dict[int, list[MaintenanceKeyData]]:
+    """
+    Load key data for modules that do not carry it, keyed by ``module_db_id``.
+
+    The modules come from the shared module-list cache, so nothing is
+    written to them; callers look the loaded key data up in the returned
+    dict instead. Postgres-sourced modules are loaded with one batched
+    staging query; the live Access fallback still loads them one module
+    at a time.
+    """
+    missing = [
+        m for m in modules
+        if not m.maintenance_key_data and m.module_db_id is not None
+    ]
+    if not missing:
+        return {}
+
+    if is_postgres_staging_available():
+        return get_key_data_batch_from_postgres(missing)
+
+    key_data_by_id: dict[int, list[MaintenanceKeyData]] = {}
+    for mod in missing:
+        _, key_data_by_id[mod.module_db_id] = get_module_detail_from_access(
+            module_db_id=mod.module_db_id,
+            module_id=mod.module_id,
+            fleet_type=mod.fleet_type,
+            km_total=mod.km_total_accumulated,
+        )
+    return key_data_by_id
+
+
+def _build_modules_data(fleet_type: str) -> tuple[list[ModuleData], list[dict]]:
+    """
+    Collect one fleet's modules and convert them for ``GridProjectionService``.
+
+    Shared by ``projection_grid`` and ``projection_export``. Key data loaded
+    for this request only ends up in ``modules_data``; the cached
+    ``ModuleData`` objects are left untouched.
+
+    Returns:
+        ``(fleet_modules, modules_data)`` where ``modules_data`` is the list
+        of plain dicts expected by ``GridProjectionService.generate_grid``,
+        in the same order as ``fleet_modules``.
+    """
+    fleet_modules = [
+        m for m in get_modules_with_fallback() if m.fleet_type == fleet_type
+    ]
+
+    # Load key_data if not populated (Access-sourced modules)
+    loaded_key_data = _load_missing_key_data(fleet_modules)
+
+    # Convert MaintenanceKeyData to dicts for the grid service
+    modules_data = [
+        {
+            "module_id": mod.module_id,
+            "fleet_type": mod.fleet_type,
+            "key_data": [
+                {
+                    "cycle_type": kd.cycle_type,
+                    "cycle_km": kd.cycle_km,
+                    "km_since": kd.km_since,
+                    "last_date": kd.last_date,
+                }
+                for kd in loaded_key_data.get(
+                    mod.module_db_id, mod.maintenance_key_data,
+                )
+            ],
+        }
+        for mod in fleet_modules
+    ]
+    return fleet_modules, modules_data
+
+
 @login_required
 @require_GET
 def projection_grid(request):
@@ -287,8 +522,6 @@ def projection_grid(request):
 
     URL: /fleet/planner/
     """
-    from datetime import date as _date
-
     fleet_param = request.GET.get("fleet", "csr").lower()
     fleet_type = "CSR" if fleet_param == "csr" else "Toshiba"
 
@@ -298,51 +531,8 @@ def projection_grid(request):
     default_avg = DEFAULT_AVG_MONTHLY_KM[fleet_type]
     avg_km = int(request.GET.get("avg_km", default_avg))
 
-    # Get modules and filter by fleet
-    all_modules = get_modules_with_fallback()
-    fleet_modules = [m for m in all_modules if m.fleet_type == fleet_type]
-
-    today = _date.today()
-
-    # Build modules_data for GridProjectionService
-    modules_data: list[dict] = []
-    for mod in fleet_modules:
-        # Load key_data if not populated (Access-sourced modules)
-        if not mod.maintenance_key_data and mod.module_db_id is not None:
-            if is_postgres_staging_available():
-                _, key_data = get_module_detail_from_postgres(
-                    module_db_id=mod.module_db_id,
-                    module_id=mod.module_id,
-                    fleet_type=mod.fleet_type,
-                    km_total=mod.km_total_accumulated,
-                    commissioning_date=mod.reference_date,
-                )
-                mod.maintenance_key_data = key_data
-            else:
-                _, key_data = get_module_detail_from_access(
-                    module_db_id=mod.module_db_id,
-                    module_id=mod.module_id,
-                    fleet_type=mod.fleet_type,
-                    km_total=mod.km_total_accumulated,
-                )
-                mod.maintenance_key_data = key_data
-
-        # Convert MaintenanceKeyData to dicts for the grid service
-        kd_list = [
-            {
-                "cycle_type": kd.cycle_type,
-                "cycle_km": kd.cycle_km,
-                "km_since": kd.km_since,
-                "last_date": kd.last_date,
-            }
-            for kd in mod.maintenance_key_data
-        ]
-
-        modules_data.append({
-            "module_id": mod.module_id,
-            "fleet_type": mod.fleet_type,
-            "key_data": kd_list,
-        })
+    fleet_modules, modules_data = _build_modules_data(fleet_type)
+    today = date.today()
 
     # Generate grid
     grid = GridProjectionService.generate_grid(
@@ -374,11 +564,11 @@ def projection_grid(request):
     top_cycle = "DA" if fleet_type == "CSR" else "RG"
 
     ranking_input: list[dict] = []
-    for mod in fleet_modules:
+    for mod, mod_data in zip(fleet_modules, modules_data):
         km_since = None
-        for kd in mod.maintenance_key_data:
-            if kd.cycle_type == top_cycle:
-                km_since = kd.km_since
+        for kd in mod_data["key_data"]:
+            if kd["cycle_type"] == top_cycle:
+                km_since = kd["km_since"]
                 break
         ranking_input.append({
             "module_id": mod.module_id,
@@ -423,8 +613,28 @@ def projection_grid(request):
     return render(request, "fleet/projection_grid.html", context)
 
 
+def _projection_export_etag(request) -> str | None:
+    """
+    ETag for ``projection_export``, or None when the export is not cacheable.
+
+    Only exports built from Postgres staging get one: that data changes only
+    when a sync runs, so the query string, today's date (projections start
+    from it) and the latest SyncLog identify the workbook. The cached module
+    list is read-only for views (key data is loaded per request), so it
+    cannot drift from that version. Live Access and stub data have no such
+    version.
+    """
+    version = get_sync_data_version()
+    if version is None or not is_postgres_staging_available():
+        return None
+    key = f"{request.get_full_path()}|{date.today().isoformat()}|{version}"
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
 @login_required
 @require_GET
+@cache_control(private=True, max_age=int(MODULES_CACHE_TTL_SECONDS))
+@condition(etag_func=_projection_export_etag)
 def projection_export(request):
     """
     Export the projection grid to an Excel file with colour formatting.
@@ -436,13 +646,6 @@ def projection_export(request):
 
     URL: /fleet/planner/export/
     """
-    from datetime import date as _date
-    from io import BytesIO
-
-    from openpyxl import Workbook
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
-
     fleet_param = request.GET.get("fleet", "csr").lower()
     fleet_type = "CSR" if fleet_param == "csr" else "Toshiba"
     months = int(request.GET.get("months", DEFAULT_MONTHS))
@@ -450,46 +653,8 @@ def projection_export(request):
     default_avg = DEFAULT_AVG_MONTHLY_KM[fleet_type]
     avg_km = int(request.GET.get("avg_km", default_avg))
 
-    all_modules = get_modules_with_fallback()
-    fleet_modules = [m for m in all_modules if m.fleet_type == fleet_type]
-    today = _date.today()
-
-    # Build modules_data (same as grid view)
-    modules_data: list[dict] = []
-    for mod in fleet_modules:
-        if not mod.maintenance_key_data and mod.module_db_id is not None:
-            if is_postgres_staging_available():
-                _, key_data = get_module_detail_from_postgres(
-                    module_db_id=mod.module_db_id,
-                    module_id=mod.module_id,
-                    fleet_type=mod.fleet_type,
-                    km_total=mod.km_total_accumulated,
-                    commissioning_date=mod.reference_date,
-                )
-                mod.maintenance_key_data = key_data
-            else:
-                _, key_data = get_module_detail_from_access(
-                    module_db_id=mod.module_db_id,
-                    module_id=mod.module_id,
-                    fleet_type=mod.fleet_type,
-                    km_total=mod.km_total_accumulated,
-                )
-                mod.maintenance_key_data = key_data
-
-        kd_list = [
-            {
-                "cycle_type": kd.cycle_type,
-                "cycle_km": kd.cycle_km,
-                "km_since": kd.km_since,
-                "last_date": kd.last_date,
-            }
-            for kd in mod.maintenance_key_data
-        ]
-        modules_data.append({
-            "module_id": mod.module_id,
-            "fleet_type": mod.fleet_type,
-            "key_data": kd_list,
-        })
+    _, modules_data = _build_modules_data(fleet_type)
+    today = date.today()
 
     grid = GridProjectionService.generate_grid(
         modules_data=modules_data,
@@ -520,44 +685,31 @@ def projection_export(request):
     hierarchy_order = CSR_HIERARCHY if fleet_type == "CSR" else TOSHIBA_HIERARCHY
 
     # --- Build Excel workbook ---
-    # Colour mapping: Tailwind class -> openpyxl hex (no leading #)
-    FILL_MAP = {
-        "AN": PatternFill("solid", fgColor="DCFCE7"),  # green-100
-        "BA": PatternFill("solid", fgColor="FEF9C3"),  # yellow-100
-        "PE": PatternFill("solid", fgColor="E0F2FE"),  # sky-100
-        "DA": PatternFill("solid", fgColor="FEE2E2"),  # red-100
-        "RB": PatternFill("solid", fgColor="FEF9C3"),  # yellow-100
-        "RG": PatternFill("solid", fgColor="FEE2E2"),  # red-100
-    }
-    FONT_MAP = {
-        "AN": Font(color="166534", bold=True),   # green-800
-        "BA": Font(color="854D0E", bold=True),   # yellow-800
-        "PE": Font(color="075985", bold=True),    # sky-800
-        "DA": Font(color="991B1B", bold=True),    # red-800
-        "RB": Font(color="854D0E", bold=True),   # yellow-800
-        "RG": Font(color="991B1B", bold=True),    # red-800
-    }
+    # Write-only workbook: rows are serialised as they are appended instead of
+    # keeping every cell object alive until save.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(f"Proyeccion {fleet_type}")
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = f"Proyeccion {fleet_type}"
+    # Column widths and frozen panes must be set before the first row is written
+    ws.column_dimensions["A"].width = 10
+    ws.column_dimensions["B"].width = 12
+    ws.column_dimensions["C"].width = 8
+    ws.column_dimensions["D"].width = 12
+    for col in range(5, 5 + months):
+        ws.column_dimensions[get_column_letter(col)].width = 12
 
-    # Header row  (columns: Modulo | Fecha | Ciclo | Umbral | months...)
-    header_font = Font(bold=True, size=10)
-    header_fill = PatternFill("solid", fgColor="F3F4F6")  # gray-100
-    headers = ["Modulo", "Fecha", "Ciclo", "Umbral"] + month_headers
+    # Freeze panes (header + module/fecha/cycle/threshold columns)
+    ws.freeze_panes = "E2"
 
-    for col_idx, h in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=h)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center")
+    # Header row  (columns: Modulo | Fecha | Ciclo | Umbral | months...)
+    headers = ["Modulo", "Fecha", "Ciclo", "Umbral", *month_headers]
+    header_style = _EXPORT_STYLES["header"]
+    ws.append([_styled_cell(ws, h, header_style) for h in headers])
 
     # Data rows
     current_row = 2
-    right_align = Alignment(horizontal="right")
-    center_align = Alignment(horizontal="center")
-    date_format = "DD/MM/YYYY"
+    center_style = _EXPORT_STYLES["center"]
+    km_style = _EXPORT_STYLES["km"]
 
     # Pre-compute intervention resets per module:
     # For each module, find all interventions and determine which rows/months
@@ -583,46 +735,36 @@ def projection_export(request):
                         reset_map[heir_key] = m_idx
 
     for module in grid:
+        n_rows = len(module.cycle_rows)
         for row_idx, cycle_row in enumerate(module.cycle_rows):
-            # Module ID (first cycle only)
+            # Module ID (first cycle only), merged down over its cycle rows
+            mod_cell = None
             if row_idx == 0:
-                mod_cell = ws.cell(
-                    row=current_row, column=1,
-                    value=module.module_id,
+                merged = n_rows > 1
+                mod_cell = _styled_cell(
+                    ws, module.module_id,
+                    _EXPORT_STYLES["module_merged" if merged else "module"],
                 )
-                mod_cell.font = Font(bold=True)
-                if len(module.cycle_rows) > 1:
-                    ws.merge_cells(
-                        start_row=current_row,
-                        start_column=1,
-                        end_row=current_row + len(module.cycle_rows) - 1,
-                        end_column=1,
-                    )
-                    mod_cell.alignment = Alignment(
-                        horizontal="center", vertical="center",
+                if merged:
+                    ws.merged_cells.add(
+                        f"A{current_row}:A{current_row + n_rows - 1}"
                     )
 
-            # Last intervention date
-            date_cell = ws.cell(
-                row=current_row, column=2,
-                value=cycle_row.last_date,
-            )
-            date_cell.alignment = center_align
-            if cycle_row.last_date:
-                date_cell.number_format = date_format
-
-            # Cycle type
-            ws.cell(
-                row=current_row, column=3,
-                value=cycle_row.cycle_type,
-            ).alignment = center_align
-
-            # Threshold
-            ws.cell(
-                row=current_row, column=4,
-                value=cycle_row.cycle_km,
-            ).alignment = right_align
-            ws.cell(row=current_row, column=4).number_format = "#,##0"
+            mark_style = _cycle_style(cycle_row.cycle_type, "mark")
+            exceeded_style = _cycle_style(cycle_row.cycle_type, "exceeded")
+
+            row = [
+                mod_cell,
+                # Last intervention date
+                _styled_cell(
+                    ws, cycle_row.last_date,
+                    _EXPORT_STYLES["date" if cycle_row.last_date else "center"],
+                ),
+                # Cycle type
+                _styled_cell(ws, cycle_row.cycle_type, center_style),
+                # Threshold
+                _styled_cell(ws, cycle_row.cycle_km, km_style),
+            ]
 
             # Determine if this row has a reset point
             reset_key = (module.module_id, cycle_row.cycle_type)
@@ -631,7 +773,6 @@ def projection_export(request):
             # Month cells (start at column 5 now)
             accumulated_after_reset = 0
             for m_idx, mp in enumerate(cycle_row.months):
-                cell = ws.cell(row=current_row, column=5 + m_idx)
                 is_intervention_cell = (
                     (module.module_id, cycle_row.cycle_type, m_idx)
                     in intervention_set
@@ -639,131 +780,77 @@ def projection_export(request):
 
                 if is_intervention_cell:
                     # Intervention mark: show cycle code text
-                    cell.value = cycle_row.cycle_type
-                    cell.alignment = center_align
-                    fill = FILL_MAP.get(cycle_row.cycle_type)
-                    font = FONT_MAP.get(cycle_row.cycle_type)
-                    if fill:
-                        cell.fill = fill
-                    if font:
-                        cell.font = font
+                    cell = _styled_cell(ws, cycle_row.cycle_type, mark_style)
                     accumulated_after_reset = 0
                 elif reset_from is not None and m_idx > reset_from:
                     # After reset: recalculate km from 0
                     accumulated_after_reset += avg_km
-                    cell.value = accumulated_after_reset
-                    cell.alignment = right_align
-                    cell.number_format = "#,##0"
                     # Apply semaphore if recalculated value exceeds threshold
-                    if accumulated_after_reset >= cycle_row.cycle_km:
-                        fill = FILL_MAP.get(cycle_row.cycle_type)
-                        font = FONT_MAP.get(cycle_row.cycle_type)
-                        if fill:
-                            cell.fill = fill
-                        if font:
-                            cell.font = font
+                    exceeded = accumulated_after_reset >= cycle_row.cycle_km
+                    cell = _styled_cell(
+                        ws, accumulated_after_reset,
+                        exceeded_style if exceeded else km_style,
+                    )
                 elif reset_from is not None and m_idx == reset_from:
                     # At reset month (heir row, not the intervention row itself):
                     # set to 0
-                    cell.value = 0
-                    cell.alignment = right_align
-                    cell.number_format = "#,##0"
+                    cell = _styled_cell(ws, 0, km_style)
                     accumulated_after_reset = 0
                 else:
                     # Normal cell: use original projection
-                    cell.value = mp.km_accumulated
-                    cell.alignment = right_align
-                    cell.number_format = "#,##0"
-                    if mp.exceeded:
-                        fill = FILL_MAP.get(cycle_row.cycle_type)
-                        font = FONT_MAP.get(cycle_row.cycle_type)
-                        if fill:
-                            cell.fill = fill
-                        if font:
-                            cell.font = font
+                    cell = _styled_cell(
+                        ws, mp.km_accumulated,
+                        exceeded_style if mp.exceeded else km_style,
+                    )
+                row.append(cell)
 
+            ws.append(row)
             current_row += 1
 
     # --- Summary rows: intervention counts per cycle per month ---
     if intervention_set:
         # Blank separator row
-        current_row += 1
+        ws.append([])
 
         # Count interventions per cycle per month
         heavy_cycles = list(reversed(
             CSR_HEAVY_CYCLES if fleet_type == "CSR"
             else TOSHIBA_HEAVY_CYCLES
         ))
-        summary_fill = PatternFill("solid", fgColor="F3F4F6")
 
         for cycle_type, cycle_label, cycle_km in heavy_cycles:
+            count_style = _cycle_style(cycle_type, "count")
             # Label cell
-            label_cell = ws.cell(
-                row=current_row, column=3, value=cycle_type,
-            )
-            label_cell.alignment = center_align
-            label_cell.font = Font(bold=True)
-            fill = FILL_MAP.get(cycle_type)
-            if fill:
-                label_cell.fill = fill
+            label = _styled_cell(ws, cycle_type, _cycle_style(cycle_type, "label"))
+            row = [None, None, label, None]
 
             # Count per month
-            total_row_count = 0
             for m_idx in range(months):
                 count = sum(
                     1 for mod_id, cyc, mi in intervention_set
                     if cyc == cycle_type and mi == m_idx
                 )
-                cell = ws.cell(
-                    row=current_row, column=5 + m_idx, value=count,
-                )
-                cell.alignment = center_align
-                if count > 0:
-                    if fill:
-                        cell.fill = fill
-                total_row_count += count
+                row.append(_styled_cell(
+                    ws, count, count_style if count > 0 else center_style,
+                ))
 
-            current_row += 1
+            ws.append(row)
 
         # Control (totals) row
-        ctrl_cell = ws.cell(row=current_row, column=3, value="Control")
-        ctrl_cell.font = Font(bold=True)
-        ctrl_cell.alignment = center_align
-        ctrl_cell.fill = summary_fill
-
+        control_style = _EXPORT_STYLES["control"]
+        row = [None, None, _styled_cell(ws, "Control", control_style), None]
         for m_idx in range(months):
             count = sum(
                 1 for _, _, mi in intervention_set if mi == m_idx
             )
-            cell = ws.cell(
-                row=current_row, column=5 + m_idx, value=count,
-            )
-            cell.alignment = center_align
-            cell.font = Font(bold=True)
-            cell.fill = summary_fill
-
-        current_row += 1
-
-    # Column widths
-    ws.column_dimensions["A"].width = 10
-    ws.column_dimensions["B"].width = 12
-    ws.column_dimensions["C"].width = 8
-    ws.column_dimensions["D"].width = 12
-    for col in range(5, 5 + months):
-        ws.column_dimensions[get_column_letter(col)].width = 12
-
-    # Freeze panes (header + module/fecha/cycle/threshold columns)
-    ws.freeze_panes = "E2"
-
-    # Write to response
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
+            row.append(_styled_cell(ws, count, control_style))
+        ws.append(row)
 
+    # Write to response (HttpResponse is file-like; no intermediate buffer)
     filename = f"proyeccion_{fleet_type.lower()}_{today.isoformat()}.xlsx"
     response = HttpResponse(
-        buf.getvalue(),
         content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    wb.save(response)
     return response